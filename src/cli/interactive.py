@@ -1,24 +1,32 @@
 import os
+from pathlib import Path
 
 from fileio.progress import console
-from rich.prompt import Confirm, Prompt
+from utils.validation import SUPPORTED_EXTENSIONS as AUDIO_EXTENSIONS
 
-WHISPER_MODELS = ["tiny", "base", "small", "medium", "large-v2", "large-v3"]
+WHISPER_MODELS = ("tiny", "base", "small", "medium", "large-v2", "large-v3")
 LANGUAGES_EXAMPLES = "auto, en, nl, de, fr, es, ja, zh, ..."
 
+_WHISPER_PROMPT = f"Whisper model ({', '.join(WHISPER_MODELS)})"
+_LANGUAGE_PROMPT = f"Audio language ({LANGUAGES_EXAMPLES})"
+
 
 def _choose_llm_model(llm_config: dict) -> tuple[str, dict]:
     """Interactive LLM model selection with provider choice and hardware recommendation.
 
     Returns (chosen_model, updated_llm_config).
     """
-    saved_model = llm_config.get("llm", {}).get("model", "llama3.1:8b") or "llama3.1:8b"
+    from rich.prompt import Confirm, Prompt
 
-    console.print()
-    console.print("  LLM provider:")
-    console.print("    [bold cyan][1][/bold cyan] Local (Ollama)")
-    console.print("    [bold cyan][2][/bold cyan] Cloud (OpenAI, Anthropic, Gemini, ...)")
-    console.print()
+    llm_section = llm_config.setdefault("llm", {})
+    saved_model = llm_section.get("model", "llama3.1:8b") or "llama3.1:8b"
+
+    console.print(
+        "\n"
+        "  LLM provider:\n"
+        "    [bold cyan][1][/bold cyan] Local (Ollama)\n"
+        "    [bold cyan][2][/bold cyan] Cloud (OpenAI, Anthropic, Gemini, ...)\n"
+    )
     provider_choice = Prompt.ask("Select provider", choices=["1", "2"], default="1")
 
     if provider_choice == "1":
@@ -26,12 +34,13 @@ def _choose_llm_model(llm_config: dict) -> tuple[str, dict]:
         recommend = Confirm.ask("Get a model recommendation based on your hardware?", default=False)
 
         if recommend:
-            console.print()
-            console.print("  Model speed:")
-            console.print("    [bold cyan][1][/bold cyan] Fast (smaller model, quicker responses)")
-            console.print("    [bold cyan][2][/bold cyan] Medium (balanced)")
-            console.print("    [bold cyan][3][/bold cyan] Slow (largest model, best quality)")
-            console.print()
+            console.print(
+                "\n"
+                "  Model speed:\n"
+                "    [bold cyan][1][/bold cyan] Fast (smaller model, quicker responses)\n"
+                "    [bold cyan][2][/bold cyan] Medium (balanced)\n"
+                "    [bold cyan][3][/bold cyan] Slow (largest model, best quality)\n"
+            )
             speed_choice = Prompt.ask("Select speed", choices=["1", "2", "3"], default="2")
             speed_map = {"1": "fast", "2": "medium", "3": "slow"}
             speed = speed_map[speed_choice]
@@ -60,29 +69,31 @@ def _choose_llm_model(llm_config: dict) -> tuple[str, dict]:
 
         provider = detect_provider(llm_model)
         if provider == "openai":
-            existing_key = llm_config.get("llm", {}).get("openai_api_key", "")
+            existing_key = llm_section.get("openai_api_key", "")
             if not existing_key and not os.environ.get("OPENAI_API_KEY"):
                 key = Prompt.ask("OpenAI API key")
-                llm_config.setdefault("llm", {})["openai_api_key"] = key
+                llm_section["openai_api_key"] = key
         elif provider == "anthropic":
-            existing_key = llm_config.get("llm", {}).get("anthropic_api_key", "")
+            existing_key = llm_section.get("anthropic_api_key", "")
             if not existing_key and not os.environ.get("ANTHROPIC_API_KEY"):
                 key = Prompt.ask("Anthropic API key")
-                llm_config.setdefault("llm", {})["anthropic_api_key"] = key
+                llm_section["anthropic_api_key"] = key
 
     # Persist the chosen model
-    llm_config.setdefault("llm", {})["model"] = llm_model
+    llm_section["model"] = llm_model
     return llm_model, llm_config
 
 
 def _choose_output_language(llm_config: dict) -> str:
     """Prompt for output language, using saved value as default."""
+    from rich.prompt import Prompt
+
     from main import get_output_language
     saved_lang = get_output_language(llm_config)
     from core.prompts import _language_name
     console.print()
     lang = Prompt.ask(
-        f"Output language code (e.g. en, nl, de, fr)",
+        "Output language code (e.g. en, nl, de, fr)",
         default=saved_lang,
     )
     return lang.strip().lower()
@@ -90,18 +101,21 @@ def _choose_output_language(llm_config: dict) -> str:
 
 def interactive_mode():
     """Guide the user through mode selection and options step by step."""
+    from rich.prompt import Confirm, Prompt
+
     from main import load_llm_config, save_llm_config, _apply_llm_config_to_env, get_last_input_path, set_last_input_path, set_output_language
 
     llm_config = load_llm_config()
     last_path = get_last_input_path(llm_config)
 
-    console.print()
-    console.print("[bold]Recap[/bold]")
-    console.print()
-    console.print("  [bold cyan][1][/bold cyan] Summarize")
-    console.print("  [bold cyan][2][/bold cyan] Generate a podcast")
-    console.print("  [bold cyan][3][/bold cyan] Record audio")
-    console.print()
+    console.print(
+        "\n"
+        "[bold]Recap[/bold]\n"
+        "\n"
+        "  [bold cyan][1][/bold cyan] Summarize\n"
+        "  [bold cyan][2][/bold cyan] Generate a podcast\n"
+        "  [bold cyan][3][/bold cyan] Record audio\n"
+    )
 
     mode = Prompt.ask("Select mode", choices=["1", "2", "3"])
 
@@ -121,34 +135,41 @@ def interactive_mode():
     podcast_input_path = None
 
     if mode == "1":
-        console.print()
-        console.print("  Input type:")
-        console.print("    [bold cyan][1][/bold cyan] Audio file (wav, mp3, m4a, ogg, flac, ...)")
-        console.print("    [bold cyan][2][/bold cyan] Text file or directory (md, pdf, docx, txt, ...)")
-        console.print()
+        console.print(
+            "\n"
+            "  Input type:\n"
+            "    [bold cyan][1][/bold cyan] Audio file (wav, mp3, m4a, ogg, flac, ...)\n"
+            "    [bold cyan][2][/bold cyan] Text file or directory (md, pdf, docx, txt, ...)\n"
+        )
         input_type = Prompt.ask("Select input type", choices=["1", "2"], default="1")
 
         if input_type == "2":
             while True:
                 input_path = Prompt.ask("Path to file or directory", default=last_path or "")
-                if os.path.isfile(input_path) or os.path.isdir(input_path):
+                p = Path(input_path)
+                if p.is_file() or p.is_dir():
                     set_last_input_path(llm_config, input_path)
                     break
                 console.print(f"  [red]Path not found:[/red] {input_path}")
 
-            if os.path.isdir(input_path):
+            if p.is_dir():
                 per_file = Confirm.ask("Summarize each file separately?", default=False)
         else:
             while True:
                 audio_file = Prompt.ask("Path to audio file", default=last_path or "")
-                if os.path.isfile(audio_file):
+                p = Path(audio_file)
+                if not p.is_file():
+                    console.print(f"  [red]File not found:[/red] {audio_file}")
+                elif p.suffix.lower() not in AUDIO_EXTENSIONS:
+                    # Re-prompt now rather than failing later in check_audio_file
+                    console.print(f"  [red]Unsupported audio format:[/red] {p.suffix or audio_file}")
+                else:
                     set_last_input_path(llm_config, audio_file)
                     break
-                console.print(f"  [red]File not found:[/red] {audio_file}")
     elif mode == "2":
         while True:
             podcast_input_path = Prompt.ask("Path to input text (file or directory)", default=last_path or "")
-            if os.path.exists(podcast_input_path):
+            if Path(podcast_input_path).exists():
                 set_last_input_path(llm_config, podcast_input_path)
                 break
             console.print(f"  [red]Path not found:[/red] {podcast_input_path}")
@@ -182,14 +203,8 @@ def interactive_mode():
 
     if customize:
         if mode == "1" and audio_file:
-            whisper_model = Prompt.ask(
-                f"Whisper model ({', '.join(WHISPER_MODELS)})",
-                choices=WHISPER_MODELS, default="medium",
-            )
-            language = Prompt.ask(
-                f"Audio language ({LANGUAGES_EXAMPLES})",
-                default="auto",
-            )
+            whisper_model = Prompt.ask(_WHISPER_PROMPT, choices=WHISPER_MODELS, default="medium")
+            language = Prompt.ask(_LANGUAGE_PROMPT, default="auto")
 
         kb_input = Prompt.ask("Knowledge base directory (empty to skip)", default="")
         if kb_input:
@@ -1,13 +1,17 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing
+from pathlib import Path
 
 from core.knowledge_base import init_kb
-from fileio.progress import console, create_progress
+from fileio.progress import console, create_progress, print_header
 from utils.validation import check_llm_model
 
 
 def run_podcast(input_path, output_dir, llm_model, kb_dir=None, kb_rebuild=False, embedding_model=None,
-                output_language="en"):
+                output_language="en", kb_workers=None, embed_quantized=False,
+                embed_device="auto"):
     """Run the podcast generation pipeline from input text."""
     from podcast.loader import load_input_text
     from podcast.scriptwriter import generate_podcast, write_podcast_output
@@ -24,71 +28,72 @@ def run_podcast(input_path, output_dir, llm_model, kb_dir=None, kb_rebuild=False
 
     config = load_podcast_config()
     style = config.get("podcast", {}).get("style", "solo")
+    tts_cfg = config.get("tts", {})
 
     enrichment_cfg = config.get("enrichment", {})
     enrichment_feeds = enrichment_cfg.get("feeds", [])
     enrichment_web = enrichment_cfg.get("web_search", False)
-    enrichment_active = bool(enrichment_feeds) or enrichment_web
 
     if output_dir is None:
         from main import DEFAULT_OUTPUT_DIR
         # Derive output dir from input name
-        input_name = os.path.splitext(os.path.basename(input_path))[0]
-        if os.path.isdir(input_path):
-            input_name = os.path.basename(os.path.normpath(input_path))
-        output_dir = os.path.join(DEFAULT_OUTPUT_DIR, f"podcast_{input_name}")
-
-    console.print("[bold]Podcast Generator[/bold]")
-    console.print(f"  Input:    {input_path} ({len(source_files)} file(s))")
-    console.print(f"  Style:    {style}")
+        # normpath keeps "." and ".." as names, where Path(".").name is empty
+        src = Path(input_path)
+        input_name = os.path.basename(os.path.normpath(input_path)) if src.is_dir() else src.stem
+        output_dir = str(Path(DEFAULT_OUTPUT_DIR) / f"podcast_{input_name}")
+
+    header = {"Input": f"{input_path} ({len(source_files)} file(s))", "Style": style}
     if output_language != "en":
         from core.prompts import _language_name
-        console.print(f"  Language: {_language_name(output_language)}")
+        header["Language"] = _language_name(output_language)
     from core.llm import detect_provider
     provider = detect_provider(llm_model)
-    console.print(f"  LLM:      {llm_model} ({provider})")
-    console.print(f"  TTS:      {config.get('tts', {}).get('engine', 'piper')}")
-    if enrichment_active:
-        parts = []
-        if enrichment_feeds:
-            parts.append(f"{len(enrichment_feeds)} feed(s)")
-        if enrichment_web:
-            parts.append("web search")
-        console.print(f"  Enrich:   {', '.join(parts)}")
-    else:
-        console.print("  Enrich:   none")
+    header["LLM"] = f"{llm_model} ({provider})"
+    header["TTS"] = tts_cfg.get("engine", "piper")
+    enrich = ", ".join(part for part in (
+        f"{len(enrichment_feeds)} feed(s)" if enrichment_feeds else None,
+        "web search" if enrichment_web else None,
+    ) if part)
+    header["Enrich"] = enrich or "none"
     if kb_dir:
-        console.print(f"  KB:       {kb_dir}")
-    console.print(f"  Output:   {output_dir}")
-    console.print()
+        header["KB"] = kb_dir
+    header["Output"] = output_dir
+    print_header("Podcast Generator", header)
 
     check_llm_model(llm_model)
     os.makedirs(output_dir, exist_ok=True)
 
-    kb = None
-
-    try:
-        with create_progress() as progress:
-            if kb_dir:
-                kb = init_kb(kb_dir, kb_rebuild, embedding_model, progress, console)
-
-            try:
-                script, sources_md = generate_podcast(
-                    input_text, config, llm_model, progress,
-                    source_files=source_files,
-                    kb=kb,
-                    output_language=output_language,
-                )
-            except Exception as e:
-                console.print(f"\n[bold red]Error:[/bold red] Podcast generation failed: {e}")
-                sys.exit(1)
+    with create_progress() as progress, ExitStack() as stack:
+        kb = None
+        if kb_dir:
+            kb = init_kb(kb_dir, kb_rebuild, embedding_model, progress, console, workers=kb_workers,
+                         quantized=embed_quantized, device=embed_device)
+            if kb:
+                stack.enter_context(closing(kb))
+
+        try:
+            script, sources_md = generate_podcast(
+                input_text, config, llm_model, progress,
+                source_files=source_files,
+                kb=kb,
+                output_language=output_language,
+            )
+        except Exception as e:
+            console.print(f"\n[bold red]Error:[/bold red] Podcast generation failed: {e}")
+            sys.exit(1)
+
+        # Script and sources are final here; write them while TTS runs
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            task_write = progress.add_task("Writing output files...", total=2)
+            write_future = writer.submit(write_podcast_output, script, sources_md, output_dir)
+            write_future.add_done_callback(lambda _: progress.update(task_write, completed=2))
 
             task_tts = progress.add_task("Generating audio...", total=1)
             audio_path = os.path.join(output_dir, "podcast.wav")
             try:
                 tts = get_tts_engine(config)
                 if style == "two_host":
-                    voice2 = config.get("tts", {}).get("voice_host2")
+                    voice2 = tts_cfg.get("voice_host2")
                     tts.synthesize_two_host(script, audio_path, voice2)
                 else:
                     tts.synthesize(script, audio_path)
@@ -97,12 +102,7 @@ def run_podcast(input_path, output_dir, llm_model, kb_dir=None, kb_rebuild=False
                 sys.exit(1)
             progress.update(task_tts, completed=1)
 
-            task_write = progress.add_task("Writing output files...", total=2)
-            script_path, sources_path = write_podcast_output(script, sources_md, output_dir)
-            progress.update(task_write, completed=2)
-    finally:
-        if kb:
-            kb.close()
+            script_path, sources_path = write_future.result()
 
     console.print()
     console.print("[bold green]Done![/bold green]")
@@ -2,15 +2,14 @@ import os
 import sys
 from datetime import datetime
 
-from pathvalidate import sanitize_filename
-
 from fileio.progress import console
 from fileio.recorder import list_input_devices, record
-from rich.prompt import Prompt
 
 
 def run_recorder(output_dir, record_name):
     """Record audio from an input device and save to a WAV file."""
+    from rich.prompt import Prompt
+
     console.print()
     console.print("[bold]Audio Recorder[/bold]")
     console.print()
@@ -20,12 +19,15 @@ def run_recorder(output_dir, record_name):
         console.print("[bold red]Error:[/bold red] No audio input devices found.")
         sys.exit(1)
 
-    console.print("  Available input devices:")
+    lines = ["  Available input devices:"]
+    valid_indices = []
     for dev in devices:
-        console.print(f"    [bold cyan][{dev['index']}][/bold cyan] {dev['name']}")
-    console.print()
+        idx = str(dev["index"])
+        valid_indices.append(idx)
+        lines.append(f"    [bold cyan][{idx}][/bold cyan] {dev['name']}")
+    lines.append("")
+    console.print("\n".join(lines))
 
-    valid_indices = [str(d["index"]) for d in devices]
     choice = Prompt.ask("Select device", choices=valid_indices)
     device_index = int(choice)
 
@@ -34,6 +36,7 @@ def run_recorder(output_dir, record_name):
     os.makedirs(output_dir, exist_ok=True)
 
     if record_name:
+        from pathvalidate import sanitize_filename
         safe_name = sanitize_filename(record_name)
         filename = f"{safe_name}.wav"
     else:
@@ -1,37 +1,94 @@
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from core.chunker import chunk_text, chunk_transcript
+from core.chunker import chunk_paragraphs, chunk_text, chunk_transcript, split_paragraphs
 from core.knowledge_base import init_kb, extract_text, find_supported_files, SUPPORTED_EXTENSIONS
 from core.llm import (
+    LLM_CONCURRENCY,
+    RESPONSE_CACHE_ENABLED,
     consolidate_summaries,
     summarize_chunk,
 )
-from fileio.progress import console, create_progress
+from fileio.progress import console, create_progress, print_header
 from fileio.writer import write_summary, write_summary_named, write_transcript
 from utils.validation import check_audio_file, check_llm_model
 
 
-def _summarize_chunks(chunks, llm_model, hint, kb, output_language, is_audio, progress):
-    """Summarize a list of chunks and consolidate into a final summary."""
-    task_summarize = progress.add_task("Summarizing chunks...", total=len(chunks))
-    chunk_summaries = []
-    for i, chunk in enumerate(chunks):
-        chunk_kb = kb.retrieve(chunk["text"], top_k=3, max_chars=1500) if kb else None
-        chunk_kb = chunk_kb or None
-        try:
-            summary = summarize_chunk(
-                chunk, i, len(chunks), llm_model,
-                hint=hint, kb_context=chunk_kb,
-                output_language=output_language, is_audio=is_audio,
-            )
-            chunk_summaries.append(summary)
-        except Exception as e:
-            console.print(f"\n[bold red]Error:[/bold red] Summarization failed on chunk {i + 1}: {e}")
-            sys.exit(1)
-        progress.update(task_summarize, advance=1)
+class ChunkSummarizationError(Exception):
+    """A chunk summary failed after retries.
+
+    completed is aligned with the chunk list and holds the summaries that did
+    finish (None elsewhere); those are already in the response cache, so
+    re-running the same command only repeats the missing ones. In per-file
+    mode, source names the failing file and written lists the (label, path)
+    outputs of the files that did finish.
+    """
+
+    def __init__(self, index: int, completed: list[str | None], cause: Exception):
+        super().__init__(index, completed, cause)
+        self.index = index
+        self.completed = completed
+        self.cause = cause
+        self.source = None
+        self.written = []
 
-    task_consolidate = progress.add_task("Consolidating summary...", total=1)
+    def __str__(self):
+        where = f" of {self.source}" if self.source else ""
+        return f"Summarization failed on chunk {self.index + 1}{where}: {self.cause}"
+
+
+def _summarize_chunks(chunks, llm_model, hint, kb, output_language, is_audio, progress, label=None):
+    """Summarize a list of chunks and consolidate into a final summary.
+
+    Chunk summaries are independent, so they are requested concurrently (at most
+    LLM_CONCURRENCY at a time) and reassembled in chunk order. KB context is
+    retrieved in LLM_CONCURRENCY-sized batches and each batch is submitted as
+    soon as its context arrives, so later retrievals overlap the LLM calls
+    already in flight instead of delaying the first one.
+    """
+    suffix = f" ({label})" if label else ""
+    task_summarize = progress.add_task(f"Summarizing chunks{suffix}...", total=len(chunks))
+
+    # Identical chunks (shared boilerplate across files) are summarized once,
+    # by their first occurrence, and the result is copied to the others
+    first_seen = {}
+    owners = [first_seen.setdefault(chunk["text"], i) for i, chunk in enumerate(chunks)]
+    unique = list(first_seen.values())
+    copies = Counter(owners)
+
+    chunk_summaries = [None] * len(chunks)
+    with ThreadPoolExecutor(max_workers=LLM_CONCURRENCY) as pool:
+        futures = {}
+        for start in range(0, len(unique), LLM_CONCURRENCY):
+            batch = unique[start:start + LLM_CONCURRENCY]
+            if kb:
+                batch_kbs = kb.retrieve_per_query(
+                    [chunks[i]["text"] for i in batch],
+                    top_k_per_query=3, max_chars=1500,
+                )
+            else:
+                batch_kbs = [None] * len(batch)
+            for i, chunk_kb in zip(batch, batch_kbs):
+                future = pool.submit(
+                    summarize_chunk, chunks[i], i, len(chunks), llm_model,
+                    hint=hint, kb_context=chunk_kb or None,
+                    output_language=output_language, is_audio=is_audio,
+                )
+                futures[future] = i
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                chunk_summaries[i] = future.result()
+            except Exception as e:
+                pool.shutdown(cancel_futures=True)
+                raise ChunkSummarizationError(i, chunk_summaries, e) from e
+            progress.update(task_summarize, advance=copies[i])
+
+    chunk_summaries = [chunk_summaries[owner] for owner in owners]
+
+    task_consolidate = progress.add_task(f"Consolidating summary{suffix}...", total=1)
     consolidation_kb = (
         kb.retrieve_multi(chunk_summaries, top_k_per_query=3, max_chars=3000)
         if kb else None
@@ -50,9 +107,158 @@ def _summarize_chunks(chunks, llm_model, hint, kb, output_language, is_audio, pr
     return final_summary
 
 
+def _summarize_per_file(input_path, output_dir, llm_model, hint, kb, output_language, progress,
+                        max_parallel_files):
+    """Directory per-file mode: one summary_<name>.md per supported file."""
+    files = find_supported_files(input_path)
+    if not files:
+        console.print(
+            f"\n[bold red]Error:[/bold red] No supported files in {input_path} "
+            f"(supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))})"
+        )
+        sys.exit(1)
+
+    def summarize_file(filepath):
+        fname = os.path.basename(filepath)
+        name_stem = os.path.splitext(fname)[0]
+        console.print(f"  Processing: {fname}")
+
+        text = extract_text(filepath)
+        if not text or not text.strip():
+            console.print(f"  [yellow]Skipping (no text):[/yellow] {fname}")
+            return None
+
+        chunks = chunk_text(text)
+        if not chunks:
+            console.print(f"  [yellow]Skipping (empty):[/yellow] {fname}")
+            return None
+
+        try:
+            final_summary = _summarize_chunks(
+                chunks, llm_model, hint, kb, output_language, False, progress,
+                label=fname,
+            )
+        except ChunkSummarizationError as e:
+            e.source = fname
+            raise
+        return write_summary_named(final_summary, output_dir, name_stem)
+
+    # Files are independent; overlap their LLM waits, keep output in file order.
+    # A failed file does not stop the others, so every summary that can be
+    # written is, and the first failure is reported along with them.
+    outputs = []
+    failure = None
+    with ThreadPoolExecutor(max_workers=max_parallel_files) as pool:
+        for future in [pool.submit(summarize_file, f) for f in files]:
+            try:
+                path = future.result()
+            except ChunkSummarizationError as e:
+                failure = failure or e
+                continue
+            if path:
+                outputs.append(("Summary", path))
+    if failure:
+        failure.written = outputs
+        raise failure
+    return outputs
+
+
+def _load_directory_chunks(input_path):
+    """Chunk every supported file under input_path as one combined text."""
+    from podcast.loader import iter_labelled_texts
+
+    files = find_supported_files(input_path)
+    if not files:
+        console.print(
+            f"\n[bold red]Error:[/bold red] No supported files found in {input_path} "
+            f"(supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))})"
+        )
+        sys.exit(1)
+
+    # Stream each file's paragraphs into the chunker rather than
+    # materializing the whole directory as one string
+    source_files = []
+
+    def paragraphs():
+        for filepath, labelled in iter_labelled_texts(files):
+            source_files.append(filepath)
+            yield from split_paragraphs(labelled)
+
+    chunks = chunk_paragraphs(paragraphs())
+    if not source_files:
+        console.print(
+            f"\n[bold red]Error:[/bold red] No extractable text found in files under {input_path}"
+        )
+        sys.exit(1)
+    console.print(f"  Loaded {len(source_files)} file(s)")
+    return chunks
+
+
+def _summarize_text(input_path, output_dir, llm_model, hint, kb, output_language, progress):
+    """Single text file, or a directory summarized as one combined text."""
+    if os.path.isdir(input_path):
+        chunks = _load_directory_chunks(input_path)
+    else:
+        text = extract_text(input_path)
+        if not text or not text.strip():
+            console.print(f"\n[bold red]Error:[/bold red] Could not extract text from {input_path}")
+            sys.exit(1)
+        chunks = chunk_text(text)
+
+    if not chunks:
+        console.print("\n[bold red]Error:[/bold red] No content to summarize.")
+        sys.exit(1)
+
+    console.print(f"  Split text into {len(chunks)} chunk(s) for summarization")
+
+    final_summary = _summarize_chunks(
+        chunks, llm_model, hint, kb, output_language, False, progress,
+    )
+
+    task_write = progress.add_task("Writing output files...", total=1)
+    s_path = write_summary(final_summary, output_dir)
+    progress.update(task_write, advance=1)
+    return [("Summary", s_path)]
+
+
+def _summarize_audio(audio_file, model, language, chunk_minutes, output_dir, llm_model, hint, kb,
+                     output_language, progress):
+    """Transcribe audio, then summarize the time-based transcript chunks."""
+    from core.transcriber import transcribe
+
+    task_transcribe = progress.add_task("Transcribing audio...", total=None)
+    try:
+        segments, duration = transcribe(audio_file, model,
+                                        None if language == "auto" else language,
+                                        progress, task_transcribe)
+    except Exception as e:
+        console.print(f"\n[bold red]Error:[/bold red] Transcription failed: {e}")
+        sys.exit(1)
+
+    if not segments:
+        console.print("\n[bold red]Error:[/bold red] No speech detected in the audio file.")
+        sys.exit(1)
+
+    chunks = chunk_transcript(segments, chunk_minutes)
+    console.print(f"  Split transcript into {len(chunks)} chunk(s) for summarization")
+
+    final_summary = _summarize_chunks(
+        chunks, llm_model, hint, kb, output_language, True, progress,
+    )
+
+    task_write = progress.add_task("Writing output files...", total=2)
+    t_path = write_transcript(segments, output_dir)
+    progress.update(task_write, advance=1)
+    s_path = write_summary(final_summary, output_dir)
+    progress.update(task_write, advance=1)
+
+    return [("Transcript", t_path), ("Summary", s_path)]
+
+
 def run_summarizer(audio_file, model, output_dir, llm_model, language, chunk_minutes,
                    kb_dir=None, kb_rebuild=False, embedding_model=None, hint=None,
-                   input_path=None, per_file=False, output_language="en"):
+                   input_path=None, per_file=False, output_language="en", max_parallel_files=4,
+                   kb_workers=None, embed_quantized=False, embed_device="auto"):
     """Run the summarization pipeline.
 
     Input modes:
@@ -64,41 +270,36 @@ def run_summarizer(audio_file, model, output_dir, llm_model, language, chunk_min
         console.print("[bold red]Error:[/bold red] Provide an audio file, --summarize PATH, or use --podcast.")
         sys.exit(1)
 
-    is_audio = bool(audio_file)
-
     # Determine what we're summarizing and print header
     if input_path and os.path.isdir(input_path):
-        console.print("[bold]Text Summarizer[/bold]")
-        console.print(f"  Directory: {input_path}")
-        console.print(f"  Per-file:  {per_file}")
+        title = "Text Summarizer"
+        header = {"Directory": input_path, "Per-file": str(per_file)}
     elif input_path:
-        console.print("[bold]Text Summarizer[/bold]")
-        console.print(f"  File: {input_path}")
+        title = "Text Summarizer"
+        header = {"File": input_path}
     else:
-        console.print("[bold]Audio Summarizer[/bold]")
+        title = "Audio Summarizer"
         from core.transcriber import _USE_MLX
         backend = "mlx-whisper (GPU)" if _USE_MLX else "faster-whisper (CPU)"
-        console.print(f"  Audio:    {audio_file}")
-        console.print(f"  Whisper:  {model} — {backend}")
-        console.print(f"  Language: {language}")
+        header = {"Audio": audio_file, "Whisper": f"{model} — {backend}", "Language": language}
 
     from core.llm import detect_provider
     provider = detect_provider(llm_model)
-    console.print(f"  LLM:      {llm_model} ({provider})")
+    header["LLM"] = f"{llm_model} ({provider})"
     if output_language != "en":
         from core.prompts import _language_name
-        console.print(f"  Output:   {_language_name(output_language)}")
+        header["Output lang"] = _language_name(output_language)
     if hint:
-        console.print(f"  Hint:     {hint}")
+        header["Hint"] = hint
     if kb_dir:
-        console.print(f"  KB:       {kb_dir}")
+        header["KB"] = kb_dir
 
     if output_dir is None:
         from main import derive_output_dir
         source = audio_file or input_path
         output_dir = derive_output_dir(source)
-    console.print(f"  Output:   {output_dir}")
-    console.print()
+    header["Output"] = output_dir
+    print_header(title, header)
 
     if audio_file:
         check_audio_file(audio_file)
@@ -110,116 +311,41 @@ def run_summarizer(audio_file, model, output_dir, llm_model, language, chunk_min
     try:
         with create_progress() as progress:
             if kb_dir:
-                kb = init_kb(kb_dir, kb_rebuild, embedding_model, progress, console)
-
-            # --- Directory per-file mode ---
-            if input_path and os.path.isdir(input_path) and per_file:
-                files = find_supported_files(input_path)
-                if not files:
-                    console.print(
-                        f"\n[bold red]Error:[/bold red] No supported files in {input_path} "
-                        f"(supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))})"
+                kb = init_kb(kb_dir, kb_rebuild, embedding_model, progress, console, workers=kb_workers,
+                             quantized=embed_quantized, device=embed_device)
+
+            try:
+                if input_path and os.path.isdir(input_path) and per_file:
+                    outputs = _summarize_per_file(
+                        input_path, output_dir, llm_model, hint, kb, output_language, progress,
+                        max_parallel_files,
                     )
-                    sys.exit(1)
-
-                summary_paths = []
-                for filepath in files:
-                    fname = os.path.basename(filepath)
-                    name_stem = os.path.splitext(fname)[0]
-                    console.print(f"  Processing: {fname}")
-
-                    text = extract_text(filepath)
-                    if not text or not text.strip():
-                        console.print(f"  [yellow]Skipping (no text):[/yellow] {fname}")
-                        continue
-
-                    chunks = chunk_text(text)
-                    if not chunks:
-                        console.print(f"  [yellow]Skipping (empty):[/yellow] {fname}")
-                        continue
-
-                    final_summary = _summarize_chunks(
-                        chunks, llm_model, hint, kb, output_language, False, progress,
+                elif input_path:
+                    outputs = _summarize_text(
+                        input_path, output_dir, llm_model, hint, kb, output_language, progress,
                     )
-                    s_path = write_summary_named(final_summary, output_dir, name_stem)
-                    summary_paths.append(s_path)
-
-                console.print()
-                console.print("[bold green]Done![/bold green]")
-                for p in summary_paths:
-                    console.print(f"  Summary: {p}")
-                return
-
-            # --- Directory combined or single text file ---
-            if input_path:
-                if os.path.isdir(input_path):
-                    from podcast.loader import load_input_text
-                    try:
-                        text, source_files = load_input_text(input_path)
-                    except ValueError as e:
-                        console.print(f"\n[bold red]Error:[/bold red] {e}")
-                        sys.exit(1)
-                    console.print(f"  Loaded {len(source_files)} file(s)")
                 else:
-                    text = extract_text(input_path)
-                    if not text or not text.strip():
-                        console.print(f"\n[bold red]Error:[/bold red] Could not extract text from {input_path}")
-                        sys.exit(1)
-
-                chunks = chunk_text(text)
-                if not chunks:
-                    console.print("\n[bold red]Error:[/bold red] No content to summarize.")
-                    sys.exit(1)
-
-                console.print(f"  Split text into {len(chunks)} chunk(s) for summarization")
-
-                final_summary = _summarize_chunks(
-                    chunks, llm_model, hint, kb, output_language, False, progress,
-                )
-
-                task_write = progress.add_task("Writing output files...", total=1)
-                s_path = write_summary(final_summary, output_dir)
-                progress.update(task_write, advance=1)
-
-                console.print()
-                console.print("[bold green]Done![/bold green]")
-                console.print(f"  Summary: {s_path}")
-                return
-
-            # --- Audio mode ---
-            from core.transcriber import transcribe, parse_transcript
-
-            task_transcribe = progress.add_task("Transcribing audio...", total=None)
-            try:
-                segments, duration = transcribe(audio_file, model,
-                                                None if language == "auto" else language,
-                                                progress, task_transcribe)
-            except Exception as e:
-                console.print(f"\n[bold red]Error:[/bold red] Transcription failed: {e}")
-                sys.exit(1)
-
-            if not segments:
-                console.print("\n[bold red]Error:[/bold red] No speech detected in the audio file.")
+                    outputs = _summarize_audio(
+                        audio_file, model, language, chunk_minutes, output_dir,
+                        llm_model, hint, kb, output_language, progress,
+                    )
+            except ChunkSummarizationError as e:
+                done = sum(summary is not None for summary in e.completed)
+                console.print(f"\n[bold red]Error:[/bold red] {e}")
+                if done and RESPONSE_CACHE_ENABLED:
+                    console.print(f"  {done}/{len(e.completed)} chunk summaries are cached; "
+                                  f"re-run the same command to resume.")
+                if e.written:
+                    console.print("  Summaries written for the other files:")
+                    for _, path in e.written:
+                        console.print(f"    {path}")
                 sys.exit(1)
-
-            chunks = chunk_transcript(segments, chunk_minutes)
-            console.print(f"  Split transcript into {len(chunks)} chunk(s) for summarization")
-
-            final_summary = _summarize_chunks(
-                chunks, llm_model, hint, kb, output_language, True, progress,
-            )
-
-            task_write = progress.add_task("Writing output files...", total=2)
-            t_path = write_transcript(segments, output_dir)
-            progress.update(task_write, advance=1)
-            s_path = write_summary(final_summary, output_dir)
-            progress.update(task_write, advance=1)
-
     finally:
         if kb:
             kb.close()
 
+    width = max((len(label) for label, _ in outputs), default=0) + 1
     console.print()
     console.print("[bold green]Done![/bold green]")
-    console.print(f"  Transcript: {t_path}")
-    console.print(f"  Summary:    {s_path}")
+    for label, path in outputs:
+        console.print(f"  {label + ':':<{width}} {path}")
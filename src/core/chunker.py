@@ -1,30 +1,88 @@
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
+
+import numpy as np
+
 CHUNK_TARGET_WORDS = 500
 
+# Below this many characters str.split() is faster than the NumPy byte scan
+_VECTOR_COUNT_MIN_CHARS = 1024
 
-def chunk_text(text: str, chunk_words: int = CHUNK_TARGET_WORDS) -> list[dict]:
-    """Split plain text into word-count-based chunks on paragraph boundaries.
+# Bytes str.split() treats as whitespace in ASCII text (\t-\r, \x1c-\x1f, space)
+_ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+_ASCII_WHITESPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
 
-    Returns a list of dicts with 'text' and 'chunk_index' keys.
+
+def _word_count(para: str) -> int:
+    """Count whitespace-separated words, equal to len(para.split()).
+
+    Long ASCII paragraphs (e.g. whole PDF pages) are counted by scanning their
+    bytes for word starts instead of building a throwaway list of substrings.
     """
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    if not paragraphs:
-        paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    if not paragraphs:
-        return []
+    if len(para) < _VECTOR_COUNT_MIN_CHARS or not para.isascii():
+        return len(para.split())
+    word = ~_ASCII_WHITESPACE[np.frombuffer(para.encode("ascii"), dtype=np.uint8)]
+    return int(word[0]) + int(np.count_nonzero(word[1:] & ~word[:-1]))
+
+
+def split_paragraphs(text: str) -> list[str]:
+    """Split text into stripped, non-empty paragraphs on blank lines.
+
+    Single pass: a line-based fallback could only ever run on whitespace-only
+    text, where it finds nothing either.
+    """
+    return [p for p in map(str.strip, text.split("\n\n")) if p]
+
+
+def iter_paragraphs(blocks: Iterable[str], joiner: str = "\n") -> Iterator[str]:
+    """Stream split_paragraphs(joiner.join(blocks)) without building the joined text.
+
+    Blocks (e.g. PDF pages) are consumed one at a time. Only the paragraph
+    still open at the end of the latest block is held back, as a list of
+    pieces that is joined once the paragraph closes.
+    """
+    pending = []   # pieces of the paragraph that has not hit a blank line yet
+    last_char = ""
+    for n, block in enumerate(blocks):
+        piece = block if n == 0 else joiner + block
+        if not piece:
+            continue
+        # A separator can straddle the boundary only via the previous last char
+        if "\n\n" not in last_char + piece:
+            pending.append(piece)
+            last_char = piece[-1]
+            continue
+        *done, rest = ("".join(pending) + piece).split("\n\n")
+        for para in done:
+            para = para.strip()
+            if para:
+                yield para
+        pending = [rest]
+        last_char = piece[-1]
+    tail = "".join(pending).strip()
+    if tail:
+        yield tail
+
 
+def chunk_paragraphs(paragraphs: Iterable[str], chunk_words: int = CHUNK_TARGET_WORDS) -> list[dict]:
+    """Group paragraphs into word-count-based chunks.
+
+    Consumes the iterable lazily, so callers can stream paragraphs from several
+    sources without first joining them into one string.
+    Returns a list of dicts with 'text' and 'chunk_index' keys.
+    """
     chunks = []
-    current_parts: list[str] = []
+    current_parts = []
     current_words = 0
-    chunk_idx = 0
 
     for para in paragraphs:
-        para_words = len(para.split())
+        para_words = _word_count(para)
         if current_words + para_words > chunk_words and current_parts:
             chunks.append({
                 "text": "\n\n".join(current_parts),
-                "chunk_index": chunk_idx,
+                "chunk_index": len(chunks),
             })
-            chunk_idx += 1
             current_parts = []
             current_words = 0
 
@@ -34,44 +92,86 @@ def chunk_text(text: str, chunk_words: int = CHUNK_TARGET_WORDS) -> list[dict]:
     if current_parts:
         chunks.append({
             "text": "\n\n".join(current_parts),
-            "chunk_index": chunk_idx,
+            "chunk_index": len(chunks),
         })
 
     return chunks
 
 
+def chunk_text(text: str, chunk_words: int = CHUNK_TARGET_WORDS) -> list[dict]:
+    """Split plain text into word-count-based chunks on paragraph boundaries.
+
+    Same chunks as chunk_paragraphs, but with every paragraph known up front
+    each chunk end is a bisect over cumulative word counts rather than a
+    running total.
+    Returns a list of dicts with 'text' and 'chunk_index' keys.
+    """
+    paragraphs = split_paragraphs(text)
+    cumulative = list(accumulate(map(_word_count, paragraphs)))
+    chunks = []
+    start = 0
+    consumed = 0   # words in paragraphs[:start]
+    while start < len(paragraphs):
+        # Longest run that stays within chunk_words, but at least one paragraph
+        end = max(bisect_right(cumulative, consumed + chunk_words, lo=start), start + 1)
+        chunks.append({
+            "text": "\n\n".join(paragraphs[start:end]),
+            "chunk_index": len(chunks),
+        })
+        consumed = cumulative[end - 1]
+        start = end
+    return chunks
+
+
+def _chunk_boundaries(ends: np.ndarray, chunk_seconds: float) -> np.ndarray:
+    """Return the index of the last segment in each chunk.
+
+    Works purely on the float64 array of segment end times; the final index is
+    always included so a trailing partial chunk is emitted.
+    """
+    last = ends.size - 1
+    out = np.empty(ends.size, dtype=np.int64)
+    n = 0
+    chunk_start = 0.0
+    i = -1
+    while i < last:
+        # First segment whose end reaches the window, clamped to the tail
+        i = min(int(np.searchsorted(ends, chunk_start + chunk_seconds, side="left")), last)
+        out[n] = i
+        n += 1
+        chunk_start = ends[i]
+    return out[:n]
+
+
 def chunk_transcript(segments: list[dict], chunk_minutes: int = 10) -> list[dict]:
     """Split transcript segments into time-based chunks.
 
     Each chunk is a dict with start_time, end_time, text, and segments.
+    Segment end times are assumed to be non-decreasing (as produced by Whisper),
+    so each chunk boundary is found with a binary search instead of a linear scan.
+    Raises ValueError if chunk_minutes is not positive.
     """
-    chunk_seconds = chunk_minutes * 60
+    if chunk_minutes <= 0:
+        raise ValueError(f"chunk_minutes must be positive, got {chunk_minutes}")
+    if not segments:
+        return []
+
+    texts = [s["text"] for s in segments]
+    ends = np.fromiter((s["end"] for s in segments), dtype=np.float64, count=len(segments))
     chunks = []
-    current_chunk_segments = []
     chunk_start = 0.0
+    prev = 0
 
-    for seg in segments:
-        current_chunk_segments.append(seg)
-
-        if seg["end"] - chunk_start >= chunk_seconds:
-            chunk_text = " ".join(s["text"] for s in current_chunk_segments)
-            chunks.append({
-                "start_time": chunk_start,
-                "end_time": seg["end"],
-                "text": chunk_text,
-                "segments": current_chunk_segments,
-            })
-            chunk_start = seg["end"]
-            current_chunk_segments = []
-
-    # Last partial chunk
-    if current_chunk_segments:
-        chunk_text = " ".join(s["text"] for s in current_chunk_segments)
+    for i in _chunk_boundaries(ends, chunk_minutes * 60).tolist():
+        current = segments[prev:i + 1]
         chunks.append({
             "start_time": chunk_start,
-            "end_time": current_chunk_segments[-1]["end"],
-            "text": chunk_text,
-            "segments": current_chunk_segments,
+            "end_time": current[-1]["end"],
+            "text": " ".join(texts[prev:i + 1]),
+            "segments": current,
         })
+        chunk_start = current[-1]["end"]
+        prev = i + 1
 
     return chunks
+
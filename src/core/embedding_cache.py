@@ -0,0 +1,92 @@
+"""Persistent on-disk cache for KB query embeddings."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections.abc import Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DEFAULT_CACHE_PATH = os.path.join(_PROJECT_ROOT, "data", "embedding_cache.sqlite")
+
+# Keep IN (...) lists under SQLite's bound-parameter limit
+_SELECT_BATCH = 500
+
+
+def embedding_key(embedding_model: str, text: str) -> str:
+    """Hash the embedding model and exact text into a cache key."""
+    payload = json.dumps([embedding_model, text])
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed map from embedding_key() to a float32 vector, safe to share across threads.
+
+    Storage errors are logged and treated as misses so a broken cache never
+    fails a retrieval.
+    """
+
+    def __init__(self, path: str = _DEFAULT_CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        """Return the cached vectors for whichever of keys are present."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        try:
+            with self._lock:
+                for i in range(0, len(keys), _SELECT_BATCH):
+                    batch = keys[i:i + _SELECT_BATCH]
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = array("f")
+                        vector.frombytes(blob)
+                        found[key] = vector.tolist()
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache read failed: %s", e)
+            return {}
+        return found
+
+    def set_many(self, vectors: dict[str, Sequence[float]]) -> None:
+        """Store vectors by key, replacing any previous entries."""
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    ((key, array("f", vector).tobytes()) for key, vector in vectors.items()),
+                )
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache write failed: %s", e)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_embedding_cache: EmbeddingCache | None = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache, opening it on first use."""
+    global _embedding_cache
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache()
+        return _embedding_cache
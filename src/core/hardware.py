@@ -1,7 +1,10 @@
+import functools
 import logging
 import os
 import platform
 import subprocess
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +30,25 @@ MODEL_RAM_REQUIREMENTS = {
     "llama3.1:70b": 48,
 }
 
+# How long the list of installed Ollama models is reused before asking again
+OLLAMA_MODELS_TTL_SECONDS = 30
 
+_ollama_models_cache: tuple[float, list[str]] | None = None
+_ollama_models_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def get_system_ram_gb() -> float:
-    """Return total system RAM in GB."""
+    """Return total system RAM in GB.
+
+    Uses psutil when installed (no subprocess, works on every platform);
+    otherwise sysctl on macOS and sysconf elsewhere.
+    """
+    try:
+        import psutil
+        return psutil.virtual_memory().total / (1024 ** 3)
+    except ImportError:
+        pass
     try:
         if platform.system() == "Darwin":
             result = subprocess.run(
@@ -45,13 +64,49 @@ def get_system_ram_gb() -> float:
         return 8.0
 
 
+@functools.lru_cache(maxsize=1)
 def is_apple_silicon() -> bool:
     """Check if running on Apple Silicon."""
     return platform.system() == "Darwin" and platform.machine() == "arm64"
 
 
+@functools.lru_cache(maxsize=1)
 def get_nvidia_vram_gb() -> float | None:
-    """Return total NVIDIA GPU VRAM in GB, or None if unavailable."""
+    """Return total NVIDIA GPU VRAM in GB, or None if unavailable.
+
+    Asks NVML directly when pynvml is installed, which avoids spawning
+    nvidia-smi; falls back to nvidia-smi otherwise.
+    """
+    vram_gb = _nvml_vram_gb()
+    if vram_gb is None:
+        vram_gb = _nvidia_smi_vram_gb()
+    return vram_gb
+
+
+def _nvml_vram_gb() -> float | None:
+    """Sum VRAM over all GPUs via NVML (optional pynvml package)."""
+    try:
+        import pynvml
+    except ImportError:
+        return None
+    try:
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    try:
+        total = sum(
+            pynvml.nvmlDeviceGetMemoryInfo(pynvml.nvmlDeviceGetHandleByIndex(i)).total
+            for i in range(pynvml.nvmlDeviceGetCount())
+        )
+        return total / (1024 ** 3) if total else None
+    except Exception:
+        return None
+    finally:
+        pynvml.nvmlShutdown()
+
+
+def _nvidia_smi_vram_gb() -> float | None:
+    """Sum VRAM over all GPUs as reported by nvidia-smi."""
     try:
         result = subprocess.run(
             ["nvidia-smi", "--query-gpu=memory.total", "--format=csv,noheader,nounits"],
@@ -67,14 +122,25 @@ def get_nvidia_vram_gb() -> float | None:
 
 
 def get_available_ollama_models() -> list[str]:
-    """Return list of locally available Ollama model names."""
-    try:
-        import ollama
-        response = ollama.list()
-        return [m.model for m in response.models]
-    except Exception:
-        logger.warning("Could not query Ollama for available models")
-        return []
+    """Return list of locally available Ollama model names.
+
+    The result is reused for OLLAMA_MODELS_TTL_SECONDS, so a model pulled in
+    the meantime shows up on a later call. Failed queries are not cached.
+    """
+    global _ollama_models_cache
+    with _ollama_models_lock:
+        cached = _ollama_models_cache
+        if cached and time.monotonic() - cached[0] < OLLAMA_MODELS_TTL_SECONDS:
+            return list(cached[1])
+        try:
+            import ollama
+            response = ollama.list()
+            models = [m.model for m in response.models]
+        except Exception:
+            logger.warning("Could not query Ollama for available models")
+            return []
+        _ollama_models_cache = (time.monotonic(), models)
+        return list(models)
 
 
 def _is_model_installed(model: str, available: list[str]) -> bool:
@@ -1,35 +1,67 @@
 import csv
+import hashlib
+import io
 import json
 import logging
 import os
+import threading
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack
 
-from qdrant_client import QdrantClient
+from core.chunker import chunk_paragraphs, chunk_text, iter_paragraphs
+from core.embedding_cache import EmbeddingCache, embedding_key, get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
 SUPPORTED_EXTENSIONS = {".txt", ".md", ".pdf", ".docx", ".html", ".htm", ".csv"}
-CHUNK_TARGET_WORDS = 500
 COLLECTION_NAME = "knowledge_base"
 DEFAULT_EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
 MODEL_META_FILE = "embedding_model.json"
+MANIFEST_FILE = "manifest.json"
+# Chunks embedded and stored per client.add call while indexing
+EMBED_BATCH_SIZE = 128
+# Files each extraction worker may run ahead of the embedding loop; caps the
+# extracted-but-not-yet-embedded text held in memory
+EXTRACT_AHEAD_PER_WORKER = 4
 
 
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 _DEFAULT_STORE_PATH = os.path.join(_PROJECT_ROOT, "data", "kb_store")
 
+# --embed-device choices mapped to the ONNX Runtime provider they ask for
+EMBED_DEVICE_PROVIDERS = {
+    "cuda": "CUDAExecutionProvider",
+    "coreml": "CoreMLExecutionProvider",
+}
+
 
 class KnowledgeBase:
     """RAG knowledge base backed by a persistent local Qdrant vector store."""
 
     def __init__(self, store_path: str = _DEFAULT_STORE_PATH,
-                 embedding_model: str = DEFAULT_EMBEDDING_MODEL):
+                 embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+                 embedding_cache: EmbeddingCache | None = None,
+                 embed_batch_size: int = EMBED_BATCH_SIZE,
+                 embedding_device: str = "auto"):
+        # Deferred: qdrant/fastembed take most of a second to import and are
+        # only needed when a KB is actually used
+        from qdrant_client import QdrantClient
+
         os.makedirs(store_path, exist_ok=True)
         self.client = QdrantClient(path=store_path)
-        self.client.set_model(embedding_model)
+        self.embedding_providers = embedding_providers(embedding_device)
+        self.client.set_model(embedding_model, providers=self.embedding_providers)
         self.collection = COLLECTION_NAME
         self.embedding_model = embedding_model
         self.store_path = store_path
         self._chunk_count = 0
+        self.embed_batch_size = embed_batch_size
+        self._embedding_cache = embedding_cache or get_embedding_cache()
+        # Serializes retrievals when one KB is shared by concurrent summarizations
+        self._lock = threading.Lock()
 
     def is_indexed(self) -> bool:
         """Check if KB collection already exists from a previous run."""
@@ -60,49 +92,164 @@ class KnowledgeBase:
             json.dump({"embedding_model": self.embedding_model}, f)
 
     def delete_collection(self) -> None:
-        """Delete existing collection (for --kb-rebuild)."""
+        """Delete existing collection and its manifest (for --kb-rebuild)."""
         if self.client.collection_exists(self.collection):
             self.client.delete_collection(self.collection)
-
-    def index_directory(self, directory: str, progress=None, task_id=None) -> int:
+        manifest_path = os.path.join(self.store_path, MANIFEST_FILE)
+        if os.path.isfile(manifest_path):
+            os.remove(manifest_path)
+
+    def has_manifest(self) -> bool:
+        """Whether the index records per-file state, so it can be updated incrementally."""
+        return os.path.isfile(os.path.join(self.store_path, MANIFEST_FILE))
+
+    def _load_manifest(self) -> dict:
+        """Return {abs_path: {"mtime_ns", "size", "ids"}} from the last indexing run."""
+        path = os.path.join(self.store_path, MANIFEST_FILE)
+        if not self.is_indexed() or not os.path.isfile(path):
+            return {}
+        with open(path, "rb") as f:
+            return _json_loads(f.read()).get("files", {})
+
+    def _save_manifest(self, files: dict) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        path = os.path.join(self.store_path, MANIFEST_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps({"files": files}))
+        os.replace(tmp_path, path)
+
+    def index_directory(self, directory: str, progress=None, task_id=None,
+                        workers: int | None = None) -> int:
         """Scan directory, extract text, chunk, embed and store in Qdrant.
 
-        Returns the number of files processed.
+        Indexing is incremental: files whose size and mtime match the manifest
+        from the previous run are skipped, and the chunks of changed or deleted
+        files are replaced or removed.
+        Point IDs are a hash of the chunk text, so identical chunks (shared
+        boilerplate, repeated rows) are embedded and stored once, with every
+        file they occur in listed in the point's "sources" payload. A point is
+        deleted only once no indexed file contains it any more.
+        Extraction and chunking (PDF/DOCX/HTML parsing is CPU-bound) run in a
+        pool of worker processes; workers defaults to one less than the CPU count.
+        Chunks are embedded and stored in batches of embed_batch_size as they arrive.
+        Returns the number of files (re)indexed with text; chunk_count covers
+        the whole index afterwards.
         """
-        files = find_supported_files(directory)
+        previous = self._load_manifest()
+        stored_sources = _sources_by_point(previous)
+        manifest = {}
+        files = []
+        for filepath in find_supported_files(directory):
+            key = os.path.abspath(filepath)
+            st = os.stat(filepath)
+            entry = previous.get(key)
+            if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                manifest[key] = entry
+            else:
+                manifest[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "ids": []}
+                files.append(filepath)
+
         if progress and task_id is not None:
             progress.update(task_id, total=len(files))
 
-        all_documents = []
-        all_metadata = []
+        added_sources = {}   # point id -> sources payload it was stored with this run
+        batch_ids = []
+        batch_documents = []
+        batch_metadata = []
         files_processed = 0
+        chunks_stored = 0
+        task_embed = None
+        if progress and task_id is not None:
+            task_embed = progress.add_task("Embedding knowledge base...", total=None)
+
+        def flush():
+            nonlocal chunks_stored
+            self._flush_batch(batch_documents, batch_metadata, batch_ids)
+            chunks_stored += len(batch_documents)
+            if task_embed is not None:
+                progress.advance(task_embed, len(batch_documents))
+            batch_ids.clear()
+            batch_documents.clear()
+            batch_metadata.clear()
+
+        if workers is None:
+            workers = default_kb_workers()
+        workers = min(workers, len(files))
+
+        with ExitStack() as stack:
+            if workers > 1:
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                results = _bounded_map(pool, _extract_and_chunk, files,
+                                       window=workers * EXTRACT_AHEAD_PER_WORKER)
+            else:
+                results = map(_extract_and_chunk, files)
+
+            # Embed in fixed-size batches as chunks arrive, so memory stays flat
+            # and workers keep extracting (a bounded number of files ahead)
+            # while the parent embeds
+            for filepath, chunks in results:
+                if chunks is not None:
+                    ids = manifest[os.path.abspath(filepath)]["ids"]
+                    for chunk in chunks:
+                        point_id = _content_id(chunk["text"])
+                        ids.append(point_id)
+                        if point_id in stored_sources or point_id in added_sources:
+                            continue
+                        added_sources[point_id] = [chunk["source"]]
+                        batch_ids.append(point_id)
+                        batch_documents.append(chunk["text"])
+                        batch_metadata.append({
+                            "sources": [chunk["source"]],
+                            "chunk_index": chunk["chunk_index"],
+                        })
+                        if len(batch_documents) >= self.embed_batch_size:
+                            flush()
+                    files_processed += 1
+                if progress and task_id is not None:
+                    progress.advance(task_id)
+
+        if batch_documents:
+            flush()
+        if task_embed is not None:
+            progress.update(task_embed, total=chunks_stored, completed=chunks_stored)
+        if chunks_stored:
+            self._save_model_meta()
 
-        for filepath in files:
-            text = extract_text(filepath)
-            if text and text.strip():
-                filename = os.path.basename(filepath)
-                chunks = _chunk_text(text, filename)
-                for chunk in chunks:
-                    all_documents.append(chunk["text"])
-                    all_metadata.append({
-                        "source": chunk["source"],
-                        "chunk_index": chunk["chunk_index"],
-                    })
-                files_processed += 1
-            if progress and task_id is not None:
-                progress.advance(task_id)
-
-        if all_documents:
-            self.client.add(
+        # Reconcile shared points: drop ones no file references any more and
+        # rewrite the sources of those whose set of files changed
+        sources = _sources_by_point(manifest)
+        stale_ids = [pid for pid in stored_sources if pid not in sources]
+        if stale_ids:
+            from qdrant_client import models
+            self.client.delete(
                 collection_name=self.collection,
-                documents=all_documents,
-                metadata=all_metadata,
+                points_selector=models.PointIdsList(points=stale_ids),
             )
-            self._save_model_meta()
+        changed = {}
+        for pid, names in sources.items():
+            if names != added_sources.get(pid, stored_sources.get(pid)):
+                changed.setdefault(tuple(names), []).append(pid)
+        for names, ids in changed.items():
+            self.client.set_payload(
+                collection_name=self.collection,
+                payload={"sources": list(names)},
+                points=ids,
+            )
+        self._save_manifest(manifest)
 
-        self._chunk_count = len(all_documents)
+        self._chunk_count = len(sources)
         return files_processed
 
+    def _flush_batch(self, documents: list[str], metadata: list[dict], ids: list[str]) -> None:
+        """Embed and store one batch of chunks."""
+        self.client.add(
+            collection_name=self.collection,
+            documents=documents,
+            metadata=metadata,
+            ids=ids,
+        )
+
     @property
     def chunk_count(self) -> int:
         """Number of chunks in the KB."""
@@ -115,24 +262,81 @@ class KnowledgeBase:
 
     @staticmethod
     def _format_points(points, max_chars: int) -> str:
-        """Format retrieved points into a context string, truncated to max_chars."""
-        parts = []
+        """Format retrieved points into a context string, truncated to max_chars.
+
+        Parts are written straight into one buffer; only their lengths are
+        tracked, so nothing is copied again by a final join.
+        """
+        buf = io.StringIO()
         total_chars = 0
         for point in points:
-            source = point.metadata.get("source", "unknown")
-            text = point.document
-            part = f"[From: {source}]\n{text}"
+            payload = point.payload
+            source = (", ".join(payload["sources"]) if "sources" in payload
+                      else payload.get("source", "unknown"))
+            text = payload.get("document", "")
+            part_len = len(source) + len(text) + 9   # "[From: " + "]\n"
 
-            if total_chars + len(part) > max_chars:
+            if total_chars + part_len > max_chars:
                 remaining = max_chars - total_chars
                 if remaining > 100:
-                    parts.append(part[:remaining] + "...")
+                    if total_chars:
+                        buf.write("\n\n")
+                    buf.write(f"[From: {source}]\n{text}"[:remaining])
+                    buf.write("...")
                 break
 
-            parts.append(part)
-            total_chars += len(part)
+            if total_chars:
+                buf.write("\n\n")
+            buf.write("[From: ")
+            buf.write(source)
+            buf.write("]\n")
+            buf.write(text)
+            total_chars += part_len
+
+        return buf.getvalue()
+
+    def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed query texts, reusing vectors from the persistent embedding cache.
 
-        return "\n\n".join(parts)
+        Misses are embedded in a single batch and written back, so a chunk or
+        summary seen in an earlier run costs no model inference.
+        """
+        keys = [embedding_key(self.embedding_model, q) for q in queries]
+        vectors = self._embedding_cache.get_many(keys)
+        missing = {k: q for k, q in zip(keys, queries) if k not in vectors}
+        if missing:
+            model = self.client.embedding_models[self.embedding_model]
+            fresh = {
+                k: v.tolist()
+                for k, v in zip(missing, model.query_embed(list(missing.values())))
+            }
+            self._embedding_cache.set_many(fresh)
+            vectors.update(fresh)
+        logger.debug("Embedding cache: %d hit(s), %d miss(es)",
+                     len(set(keys)) - len(missing), len(missing))
+        return [vectors[k] for k in keys]
+
+    def _search(self, queries: list[str], limit: int, min_score: float) -> list[list]:
+        """Run one vector search per query in a single batch, aligned with queries.
+
+        Points scoring below min_score are dropped by Qdrant, so their payloads
+        are never returned; stored vectors are never returned either.
+        """
+        from qdrant_client import models
+
+        with self._lock:
+            vector_name = self.client.get_vector_field_name()
+            requests = [
+                models.SearchRequest(
+                    vector=models.NamedVector(name=vector_name, vector=vector),
+                    limit=limit,
+                    with_payload=True,
+                    with_vector=False,
+                    score_threshold=min_score,
+                )
+                for vector in self._embed_queries(queries)
+            ]
+            return self.client.search_batch(collection_name=self.collection, requests=requests)
 
     def retrieve(self, query: str, top_k: int = 5, max_chars: int = 4500,
                  min_score: float = 0.4) -> str:
@@ -144,16 +348,7 @@ class KnowledgeBase:
         if not self.is_indexed():
             return ""
 
-        results = self.client.query(
-            collection_name=self.collection,
-            query_text=query,
-            limit=top_k,
-        )
-
-        if not results:
-            return ""
-
-        results = [p for p in results if p.score >= min_score]
+        results = self._search([query], top_k, min_score)[0]
         if not results:
             return ""
 
@@ -164,32 +359,41 @@ class KnowledgeBase:
         """Query KB with multiple queries, deduplicate, and return top results.
 
         Returns a formatted context string, or empty string if nothing relevant.
+        All queries are embedded and searched in one batch.
         """
-        if not self.is_indexed():
+        if not queries or not self.is_indexed():
             return ""
 
         # Collect best score per point ID across all queries
         best: dict[str | int, tuple[float, object]] = {}
-        for query in queries:
-            results = self.client.query(
-                collection_name=self.collection,
-                query_text=query,
-                limit=top_k_per_query,
-            )
+        for results in self._search(queries, top_k_per_query, min_score):
             for point in results:
                 pid = point.id
                 if pid not in best or point.score > best[pid][0]:
                     best[pid] = (point.score, point)
 
-        # Filter by min_score and sort descending
-        scored = [(score, point) for score, point in best.values() if score >= min_score]
-        scored.sort(key=lambda x: x[0], reverse=True)
+        scored = sorted(best.values(), key=lambda x: x[0], reverse=True)
 
         if not scored:
             return ""
 
         return self._format_points([point for _, point in scored], max_chars)
 
+    def retrieve_per_query(self, queries: list[str], top_k_per_query: int = 3,
+                           max_chars: int = 4500, min_score: float = 0.4) -> list[str]:
+        """Batched retrieve() over queries, returning one context string per query.
+
+        All queries are embedded and searched in one batch; the result is
+        aligned with queries, with empty strings where nothing was relevant.
+        """
+        if not queries or not self.is_indexed():
+            return [""] * len(queries)
+
+        contexts = []
+        for results in self._search(queries, top_k_per_query, min_score):
+            contexts.append(self._format_points(results, max_chars) if results else "")
+        return contexts
+
     def close(self) -> None:
         """Close the Qdrant client."""
         self.client.close()
@@ -198,19 +402,29 @@ class KnowledgeBase:
 # --- Shared KB initialization helper ---
 
 
-def init_kb(kb_dir, kb_rebuild, embedding_model, progress, console):
+def init_kb(kb_dir, kb_rebuild, embedding_model, progress, console, workers=None, quantized=False,
+            device="auto"):
     """Initialize and optionally index a KnowledgeBase.
 
     Returns a KnowledgeBase instance, or None if KB is empty/unavailable.
     Handles model mismatch checks and indexing with progress feedback.
+    With quantized, the embedding model is swapped for its quantized variant
+    when fastembed has one. device is "auto", "cpu", "cuda" or "coreml" (see
+    embedding_providers).
     """
     import sys
 
+    if quantized:
+        embedding_model = quantized_embedding_model(embedding_model or DEFAULT_EMBEDDING_MODEL)
     kb_kwargs = {}
     if embedding_model:
         kb_kwargs["embedding_model"] = embedding_model
-    kb = KnowledgeBase(**kb_kwargs)
-    console.print(f"  Embed:    {kb.embedding_model}")
+    kb = KnowledgeBase(embedding_device=device, **kb_kwargs)
+    if kb.embedding_providers:
+        device_name = kb.embedding_providers[0].removesuffix("ExecutionProvider")
+        console.print(f"  Embed:    {kb.embedding_model} ({device_name})")
+    else:
+        console.print(f"  Embed:    {kb.embedding_model}")
 
     mismatched_model = kb.check_model_mismatch()
     if mismatched_model:
@@ -224,21 +438,25 @@ def init_kb(kb_dir, kb_rebuild, embedding_model, progress, console):
         console.print("  Rebuilding knowledge base index...")
         kb.delete_collection()
 
-    if kb.is_indexed() and not kb_rebuild:
+    if kb.is_indexed() and not kb.has_manifest():
+        # Index predates per-file tracking; it can only be refreshed with --kb-rebuild
         console.print(f"  KB loaded from cache ({kb.chunk_count} chunks)")
     else:
         task_kb = progress.add_task("Indexing knowledge base...", total=None)
         try:
-            files_loaded = kb.index_directory(kb_dir, progress, task_kb)
+            files_loaded = kb.index_directory(kb_dir, progress, task_kb, workers=workers)
         except Exception as e:
             console.print(f"\n[bold red]Error:[/bold red] KB indexing failed: {e}")
             kb.close()
             sys.exit(1)
-        if files_loaded == 0:
+        if kb.chunk_count == 0:
             console.print("  [yellow]Warning:[/yellow] No supported files found in KB directory.")
             kb.close()
             return None
-        console.print(f"  Indexed {files_loaded} file(s), {kb.chunk_count} chunks")
+        if files_loaded:
+            console.print(f"  Indexed {files_loaded} file(s), {kb.chunk_count} chunks")
+        else:
+            console.print(f"  KB up to date ({kb.chunk_count} chunks)")
 
     return kb
 
@@ -246,19 +464,164 @@ def init_kb(kb_dir, kb_rebuild, embedding_model, progress, console):
 # --- File discovery ---
 
 
+def quantized_embedding_model(model: str) -> str:
+    """Return fastembed's quantized variant of model, or model if it has none.
+
+    Some models ship as their own quantized entry (e.g. nomic-embed-text-v1.5-Q);
+    others, such as the default bge-small-en-v1.5, are already quantized ONNX.
+    """
+    from fastembed import TextEmbedding
+
+    supported = {m["model"] for m in TextEmbedding.list_supported_models()}
+    for suffix in ("-Q", "-quantized"):
+        if model + suffix in supported:
+            return model + suffix
+    return model
+
+
+def embedding_providers(device: str = "auto") -> list[str] | None:
+    """Return the ONNX Runtime providers for embedding on device, or None for fastembed's CPU default.
+
+    "auto" uses CUDA when onnxruntime was built with it and an NVIDIA GPU is
+    present; CoreML is only used when asked for, as it falls back to CPU for
+    parts of transformer graphs and is not reliably faster. A requested
+    provider that onnxruntime lacks is logged and CPU is used instead.
+    """
+    if device == "cpu":
+        return None
+    import onnxruntime
+
+    available = onnxruntime.get_available_providers()
+    if device == "auto":
+        from core.hardware import get_nvidia_vram_gb
+
+        if "CUDAExecutionProvider" not in available or not get_nvidia_vram_gb():
+            return None
+        provider = "CUDAExecutionProvider"
+    else:
+        provider = EMBED_DEVICE_PROVIDERS[device]
+        if provider not in available:
+            logger.warning("%s is not available in this onnxruntime build, embedding on CPU", provider)
+            return None
+    return [provider, "CPUExecutionProvider"]
+
+
+def _bounded_map(pool: Executor, fn: Callable, items: Iterable, window: int) -> Iterator:
+    """Like pool.map(fn, items), but with at most window calls submitted ahead of the consumer.
+
+    Executor.map submits every item up front, so results pile up in memory
+    whenever the consumer is slower than the pool.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(pool.submit(fn, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def default_kb_workers() -> int:
+    """Default number of KB extraction processes: leave one core for the main process."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact UTF-8 JSON; uses orjson when installed (the manifest grows with the KB)."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(obj)
+
+
+def _json_loads(data: bytes):
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _content_id(text: str) -> str:
+    """Deterministic Qdrant point ID (a UUID) for a chunk's text."""
+    return str(uuid.UUID(bytes=hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()))
+
+
+def _sources_by_point(manifest: dict) -> dict[str, list[str]]:
+    """Map each point ID in a manifest to the names of the files containing it, in file order."""
+    sources = {}
+    for path, entry in manifest.items():
+        name = os.path.basename(path)
+        for point_id in entry["ids"]:
+            names = sources.setdefault(point_id, [])
+            if name not in names:
+                names.append(name)
+    return sources
+
+
+def _extract_and_chunk(filepath: str) -> tuple[str, list[dict] | None]:
+    """Extract and chunk one file; top-level so it can run in a worker process.
+
+    PDFs are streamed page by page into the chunker instead of being joined
+    into one string first. Returns (filepath, chunks), with chunks None when
+    no text was extracted.
+    """
+    source = os.path.basename(filepath)
+    if os.path.splitext(filepath)[1].lower() == ".pdf":
+        try:
+            chunks = _chunk_text(iter_paragraphs(_iter_pdf_pages(filepath)), source)
+        except Exception:
+            logger.warning("Failed to extract text from %s: %s", filepath, _exc_summary())
+            return filepath, None
+        return filepath, chunks or None
+
+    text = extract_text(filepath)
+    if not text or not text.strip():
+        return filepath, None
+    return filepath, _chunk_text(text, source)
+
+
 def find_supported_files(directory: str) -> list[str]:
-    """Recursively find all supported files in directory."""
+    """Recursively find all supported files in directory.
+
+    Files in a directory come first (sorted by name), then its subdirectories.
+    Uses os.scandir so file/directory checks come from the cached dirent type
+    instead of a stat per entry; symlinked directories are not followed.
+    """
     found = []
-    for root, _dirs, files in os.walk(directory):
-        for fname in sorted(files):
-            if fname.startswith("."):
-                continue
-            ext = os.path.splitext(fname)[1].lower()
-            if ext in SUPPORTED_EXTENSIONS:
-                found.append(os.path.join(root, fname))
+    _scan_supported(directory, found)
     return found
 
 
+def _scan_supported(directory: str, found: list[str]) -> None:
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry)
+                    continue
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in SUPPORTED_EXTENSIONS:
+                    files.append(entry)
+    except OSError:
+        return
+    files.sort(key=lambda e: e.name)
+    found.extend(e.path for e in files)
+    for entry in sorted(subdirs, key=lambda e: e.name):
+        _scan_supported(entry.path, found)
+
+
 # --- Text extraction (lazy imports for optional deps) ---
 
 
@@ -295,13 +658,16 @@ def _extract_plaintext(filepath: str) -> str:
 
 
 def _extract_pdf(filepath: str) -> str:
+    return "\n".join(_iter_pdf_pages(filepath))
+
+
+def _iter_pdf_pages(filepath: str) -> Iterator[str]:
+    """Yield the text of each PDF page in order."""
     import pymupdf
 
-    text_parts = []
     with pymupdf.open(filepath) as doc:
         for page in doc:
-            text_parts.append(page.get_text())
-    return "\n".join(text_parts)
+            yield page.get_text()
 
 
 def _extract_docx(filepath: str) -> str:
@@ -321,55 +687,33 @@ def _extract_html(filepath: str) -> str:
 
 
 def _extract_csv(filepath: str) -> str:
+    """Render each data row as 'header: value; ...', skipping empty cells.
+
+    Rows are streamed from the reader rather than loaded as a list first, and
+    the 'header: ' labels are built once per file instead of once per cell.
+    """
     with open(filepath, encoding="utf-8", errors="replace") as f:
         reader = csv.reader(f)
-        rows = list(reader)
-    if not rows:
-        return ""
-    header = rows[0]
-    lines = []
-    for row in rows[1:]:
-        pairs = [f"{h}: {v}" for h, v in zip(header, row) if v.strip()]
-        lines.append("; ".join(pairs))
-    return "\n".join(lines)
+        header = next(reader, None)
+        if header is None:
+            return ""
+        labels = [f"{h}: " for h in header]
+        return "\n".join(
+            "; ".join([label + v for label, v in zip(labels, row) if v.strip()])
+            for row in reader
+        )
 
 
 # --- Text chunking ---
 
 
-def _chunk_text(text: str, source: str) -> list[dict]:
-    """Split text into ~500-word chunks on paragraph boundaries."""
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    if not paragraphs:
-        paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    if not paragraphs:
-        return []
-
-    chunks = []
-    current_parts = []
-    current_words = 0
-    chunk_idx = 0
-
-    for para in paragraphs:
-        para_words = len(para.split())
-        if current_words + para_words > CHUNK_TARGET_WORDS and current_parts:
-            chunks.append({
-                "text": "\n\n".join(current_parts),
-                "source": source,
-                "chunk_index": chunk_idx,
-            })
-            chunk_idx += 1
-            current_parts = []
-            current_words = 0
-
-        current_parts.append(para)
-        current_words += para_words
-
-    if current_parts:
-        chunks.append({
-            "text": "\n\n".join(current_parts),
-            "source": source,
-            "chunk_index": chunk_idx,
-        })
+def _chunk_text(text: str | Iterable[str], source: str) -> list[dict]:
+    """Split text into ~500-word chunks on paragraph boundaries, tagged with source.
 
+    text may also be an iterable of already-split paragraphs (see
+    core.chunker.iter_paragraphs), which is consumed lazily.
+    """
+    chunks = chunk_text(text) if isinstance(text, str) else chunk_paragraphs(text)
+    for chunk in chunks:
+        chunk["source"] = source
     return chunks
@@ -1,12 +1,18 @@
+import functools
+import io
 import json
 import logging
 import os
+import random
+import re
+import threading
 import time
-
-import litellm
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+from core.llm_cache import cache_key, get_response_cache
 from core.prompts import (
     ARTICLE_RANKING_SYSTEM,
     article_ranking_prompt,
@@ -20,12 +26,94 @@ from core.prompts import (
     two_host_script_system,
 )
 
-# Suppress litellm's verbose logging
-litellm.suppress_debug_info = True
-
 DEFAULT_NUM_CTX = 8192
+# How long a cached article ranking stays valid; summaries never expire since
+# they are a pure function of their inputs, and podcast scripts are not cached
+RANKING_CACHE_TTL = 24 * 60 * 60
+# A non-empty JSON array of non-negative integers, as asked for by the ranking prompt
+_INDEX_ARRAY_RE = re.compile(r"\[\s*\d+(?:\s*,\s*\d+)*\s*\]")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment, or return default."""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        logger.warning("Ignoring %s=%r (expected a positive integer), using %d", name, value, default)
+        return default
+    return number
+
+
+# Max number of LLM requests in flight at once across the whole process, however
+# many pools (per-file summaries, chunk summaries, ranking groups) issue them;
+# set RECAP_LLM_CONCURRENCY=1 for a server that can only serve one request at a time
+LLM_CONCURRENCY = _env_int("RECAP_LLM_CONCURRENCY", 4)
+_llm_slots = threading.BoundedSemaphore(LLM_CONCURRENCY)
+# Set RECAP_LLM_CACHE=0 to always query the model instead of replaying
+# responses from the on-disk cache (and to leave the cache untouched)
+RESPONSE_CACHE_ENABLED = os.environ.get("RECAP_LLM_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+# Rankings over more articles than this are split into groups of this size,
+# ranked in parallel, and the groups' picks re-ranked together
+RANKING_GROUP_SIZE = 20
+# Retry delays grow as RETRY_BASE_DELAY * 2**attempt (capped), plus up to 1s of jitter
+RETRY_BASE_DELAY = 2
+RETRY_MAX_DELAY = 60
+# After this many successful calls to a cloud (model, num_ctx) pair, call_llm
+# makes an extra, early attempt that times out at LATENCY_TIMEOUT_FACTOR x the
+# average latency (never below LATENCY_TIMEOUT_MIN seconds), so a straggler is
+# cut off and re-sent instead of waited out. Local ollama servers queue requests
+# they cannot run yet, where a slow answer means waiting in line, not a stuck one
+LATENCY_WARMUP_CALLS = 5
+LATENCY_TIMEOUT_FACTOR = 1.5
+LATENCY_TIMEOUT_MIN = 10
+# (model, num_ctx) -> (exponential moving average of latency in seconds, successful calls)
+_LATENCY_EMA: dict[tuple[str, int], tuple[float, int]] = {}
+_latency_lock = threading.Lock()
+
+
+_litellm_module = None
+_litellm_lock = threading.Lock()
+
+
+def _litellm():
+    """Import and configure litellm on first use.
 
+    The import alone takes seconds, so it is deferred until a request is made
+    rather than paid by every CLI invocation (--help, validation errors, ...).
+    The first requests usually come from several pool threads at once, and
+    concurrent first imports of litellm can deadlock or see a half-initialized
+    module, so the import runs under a lock.
+    """
+    global _litellm_module
+    if _litellm_module is None:
+        with _litellm_lock:
+            if _litellm_module is None:
+                import litellm
+                # Suppress litellm's verbose logging
+                litellm.suppress_debug_info = True
+                _litellm_module = litellm
+    return _litellm_module
 
+
+@functools.cache
+def _permanent_errors() -> tuple[type[Exception], ...]:
+    """Errors that would fail the same way on every attempt (bad key, bad
+    request, unknown model), so retrying them only delays the error message."""
+    litellm = _litellm()
+    return (
+        litellm.AuthenticationError,
+        litellm.PermissionDeniedError,
+        litellm.BadRequestError,
+        litellm.NotFoundError,
+    )
+
+
+@functools.lru_cache(maxsize=64)
 def detect_provider(model_name: str) -> str:
     """Detect the LLM provider from the model name."""
     lower = model_name.lower()
@@ -52,6 +140,32 @@ def _set_api_keys_from_config(llm_config: dict | None) -> None:
             os.environ[env_key] = value
 
 
+def _completion_kwargs(
+    prompt: str, system_prompt: str, llm_model: str, num_ctx: int, timeout: int,
+) -> dict:
+    """Build the litellm.completion arguments for one request."""
+    provider = detect_provider(llm_model)
+
+    # Build the model string for litellm
+    if provider == "ollama":
+        model_str = f"ollama/{llm_model}"
+    else:
+        model_str = llm_model
+
+    kwargs = {
+        "model": model_str,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0.3,
+        "timeout": timeout,
+    }
+    if provider == "ollama":
+        kwargs["num_ctx"] = num_ctx
+    return kwargs
+
+
 def call_llm(
     prompt: str,
     system_prompt: str,
@@ -60,38 +174,146 @@ def call_llm(
     retries: int = 1,
     timeout: int = 120,
 ) -> str:
-    provider = detect_provider(llm_model)
+    bucket = (llm_model, num_ctx)
+    # Built once; attempts only differ in their timeout
+    kwargs = _completion_kwargs(prompt, system_prompt, llm_model, num_ctx, timeout)
+
+    if detect_provider(llm_model) != "ollama":
+        early_timeout = _adaptive_timeout(bucket, timeout)
+        if early_timeout < timeout:
+            # Not counted against retries: if it fails, the normal attempts follow
+            try:
+                return _complete({**kwargs, "timeout": early_timeout}, bucket)
+            except Exception as e:
+                if isinstance(e, _permanent_errors()):
+                    raise
+                logger.info("LLM call exceeded its %.0fs adaptive timeout, re-sending: %s", early_timeout, e)
+
+    return _with_retries(lambda n: _complete(kwargs, bucket), retries)
+
+
+def _complete(kwargs: dict, bucket: tuple[str, int]) -> str:
+    """Send one completion request and record its latency for bucket.
+
+    Timing starts once a concurrency slot is held, so waiting behind this
+    process's other requests does not count as model latency.
+    """
+    with _llm_slots:
+        start = time.monotonic()
+        response = _litellm().completion(**kwargs)
+        _record_latency(bucket, time.monotonic() - start)
+    return response.choices[0].message.content
+
+
+def _adaptive_timeout(bucket: tuple[str, int], timeout: float) -> float:
+    """Return the first-attempt timeout for bucket, at most the caller's timeout."""
+    with _latency_lock:
+        ema, calls = _LATENCY_EMA.get(bucket, (0.0, 0))
+    if calls < LATENCY_WARMUP_CALLS:
+        return timeout
+    return min(timeout, max(LATENCY_TIMEOUT_MIN, LATENCY_TIMEOUT_FACTOR * ema))
+
+
+def _record_latency(bucket: tuple[str, int], elapsed: float) -> None:
+    """Fold one successful call's latency into the bucket's moving average."""
+    with _latency_lock:
+        ema, calls = _LATENCY_EMA.get(bucket, (elapsed, 0))
+        _LATENCY_EMA[bucket] = (0.8 * ema + 0.2 * elapsed, calls + 1)
 
-    # Build the model string for litellm
-    if provider == "ollama":
-        model_str = f"ollama/{llm_model}"
-    else:
-        model_str = llm_model
 
-    for attempt in range(retries + 1):
+def _with_retries(attempt: Callable[[int], str], retries: int) -> str:
+    """Run attempt(n) for n = 0, 1, ..., retrying up to retries more times if it raises.
+
+    Retries back off exponentially with jitter, so parallel callers hitting the
+    same rate limit do not all come back at once. Permanent errors are raised
+    immediately.
+    """
+    for n in range(retries + 1):
         try:
-            kwargs = {
-                "model": model_str,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
-                "temperature": 0.3,
-                "timeout": timeout,
-            }
-            if provider == "ollama":
-                kwargs["num_ctx"] = num_ctx
-
-            response = litellm.completion(**kwargs)
-            return response.choices[0].message.content
+            return attempt(n)
         except Exception as e:
-            if attempt < retries:
-                logger.warning("LLM call attempt %d/%d failed: %s", attempt + 1, retries + 1, e)
-                time.sleep(2)
+            if n < retries and not isinstance(e, _permanent_errors()):
+                logger.warning("LLM call attempt %d/%d failed: %s", n + 1, retries + 1, e)
+                time.sleep(min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** n) + random.uniform(0, 1))
                 continue
             raise
 
 
+def _stream_deltas(kwargs: dict) -> Iterator[str]:
+    """Yield the non-empty content pieces of a streamed completion request.
+
+    The request holds one of the LLM_CONCURRENCY slots until the stream ends.
+    """
+    with _llm_slots:
+        for chunk in _litellm().completion(stream=True, **kwargs):
+            # Some providers end the stream with a usage-only chunk and no choices
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+
+def call_llm_streamed(
+    prompt: str,
+    system_prompt: str,
+    llm_model: str,
+    num_ctx: int = DEFAULT_NUM_CTX,
+    retries: int = 1,
+    timeout: int = 120,
+    on_progress: Callable[[int], None] | None = None,
+) -> str:
+    """call_llm over a streamed response, calling on_progress as pieces arrive.
+
+    Suited to long generations: progress can be shown from the first token,
+    and the timeout applies between pieces rather than to the whole answer.
+    on_progress receives the number of characters the current attempt has
+    received so far; a failed attempt is retried from scratch, so the count
+    starts again from zero.
+    """
+    kwargs = _completion_kwargs(prompt, system_prompt, llm_model, num_ctx, timeout)
+
+    def attempt(n):
+        buf = io.StringIO()
+        for delta in _stream_deltas(kwargs):
+            buf.write(delta)
+            if on_progress:
+                on_progress(buf.tell())
+        return buf.getvalue()
+
+    return _with_retries(attempt, retries)
+
+
+def _cached_call_llm(
+    prompt: str,
+    system_prompt: str,
+    llm_model: str,
+    num_ctx: int = DEFAULT_NUM_CTX,
+    ttl: float | None = None,
+    validate=None,
+    **kwargs,
+) -> str:
+    """call_llm, memoized in the persistent response cache.
+
+    Only for calls whose answer is fully determined by the prompts; creative
+    output (podcast scripts) goes through call_llm directly so reruns differ.
+    Entries older than ttl seconds are refreshed. If validate is given, a
+    response is only cached when validate(response) is true, so an unusable
+    answer is retried on the next run instead of being replayed.
+    """
+    if not RESPONSE_CACHE_ENABLED:
+        return call_llm(prompt, system_prompt, llm_model, num_ctx=num_ctx, **kwargs)
+    cache = get_response_cache()
+    key = cache_key(llm_model, system_prompt, prompt, num_ctx)
+    cached = cache.get(key, max_age=ttl)
+    if cached is not None:
+        return cached
+    response = call_llm(prompt, system_prompt, llm_model, num_ctx=num_ctx, **kwargs)
+    if response and (validate is None or validate(response)):
+        cache.set(key, response)
+    return response
+
+
 def summarize_chunk(
     chunk: dict, chunk_index: int, total_chunks: int, llm_model: str,
     hint: str | None = None, kb_context: str | None = None,
@@ -102,7 +324,7 @@ def summarize_chunk(
         hint, kb_context=kb_context,
         output_language=output_language, is_audio=is_audio,
     )
-    return call_llm(prompt, system, llm_model)
+    return _cached_call_llm(prompt, system, llm_model)
 
 
 def consolidate_summaries(
@@ -115,7 +337,7 @@ def consolidate_summaries(
         hint, kb_context=kb_context,
         output_language=output_language, is_audio=is_audio,
     )
-    return call_llm(prompt, system, llm_model, num_ctx=16384, timeout=300)
+    return _cached_call_llm(prompt, system, llm_model, num_ctx=16384, timeout=300)
 
 
 # --- Podcast functions ---
@@ -123,22 +345,69 @@ def consolidate_summaries(
 def rank_articles(
     articles: list[dict], reference_text: str, max_articles: int, llm_model: str,
 ) -> list[int]:
-    """Return indices of the most relevant articles, ordered by relevance."""
-    prompt = article_ranking_prompt(articles, reference_text, max_articles)
-    response = call_llm(prompt, ARTICLE_RANKING_SYSTEM, llm_model)
+    """Return indices of the most relevant articles, ordered by relevance.
 
-    # Parse JSON array from response
-    try:
-        # Find the JSON array in the response
-        text = response.strip()
-        start = text.index("[")
-        end = text.rindex("]") + 1
-        indices = json.loads(text[start:end])
-        # Filter to valid indices
-        return [i for i in indices if isinstance(i, int) and 0 <= i < len(articles)][:max_articles]
-    except (ValueError, json.JSONDecodeError):
+    Up to RANKING_GROUP_SIZE articles are ranked in one call. Longer lists are
+    ranked group by group in parallel (map), then the union of each group's
+    picks is ranked once more (reduce), so no prompt has to list every article.
+    """
+    if len(articles) <= RANKING_GROUP_SIZE:
+        return _rank_group(articles, reference_text, max_articles, llm_model)
+
+    offsets = range(0, len(articles), RANKING_GROUP_SIZE)
+    with ThreadPoolExecutor(max_workers=LLM_CONCURRENCY) as pool:
+        picks = pool.map(
+            lambda start: [start + i for i in _rank_group(
+                articles[start:start + RANKING_GROUP_SIZE], reference_text, max_articles, llm_model,
+            )],
+            offsets,
+        )
+        candidates = [i for group in picks for i in group]
+    if not candidates:
+        return []
+    final = _rank_group([articles[i] for i in candidates], reference_text, max_articles, llm_model)
+    return [candidates[i] for i in final]
+
+
+def _rank_group(
+    articles: list[dict], reference_text: str, max_articles: int, llm_model: str,
+) -> list[int]:
+    """Rank articles with a single LLM call."""
+    prompt = article_ranking_prompt(articles, reference_text, max_articles)
+    response = _cached_call_llm(
+        prompt, ARTICLE_RANKING_SYSTEM, llm_model, ttl=RANKING_CACHE_TTL,
+        validate=lambda r: _parse_ranking(r, len(articles), max_articles) is not None,
+    )
+    indices = _parse_ranking(response, len(articles), max_articles)
+    if indices is None:
         logger.warning("Article ranking failed to parse LLM response, skipping articles")
         return []
+    return indices
+
+
+def _parse_ranking(response: str, num_articles: int, max_articles: int) -> list[int] | None:
+    """Parse the JSON index array from a ranking response, or None if there is none.
+
+    The expected answer is a flat array of integers. The last such array is
+    taken, since a reply may quote an example format before giving its answer;
+    if there is none (e.g. []), json.loads is tried on the span from the first
+    "[" to the last "]".
+    """
+    match = None
+    for match in _INDEX_ARRAY_RE.finditer(response):
+        pass
+    if match:
+        indices = [int(i) for i in match.group()[1:-1].split(",")]
+    else:
+        try:
+            text = response.strip()
+            start = text.index("[")
+            end = text.rindex("]") + 1
+            indices = json.loads(text[start:end])
+        except (ValueError, json.JSONDecodeError):
+            return None
+    # Filter to valid indices
+    return [i for i in indices if isinstance(i, int) and 0 <= i < num_articles][:max_articles]
 
 
 def generate_podcast_script(
@@ -146,19 +415,26 @@ def generate_podcast_script(
     articles: list[dict] | None = None,
     kb_context: str | None = None,
     output_language: str = "en",
+    on_progress: Callable[[int], None] | None = None,
 ) -> str:
-    """Generate a podcast script in solo or two_host style."""
+    """Generate a podcast script in solo or two_host style.
+
+    The script is streamed; on_progress, if given, receives the number of
+    characters generated so far (see call_llm_streamed).
+    """
     if style == "two_host":
         prompt = two_host_script_prompt(
             input_text, target_length,
             articles=articles, kb_context=kb_context,
         )
         system = two_host_script_system(output_language=output_language)
-        return call_llm(prompt, system, llm_model, num_ctx=16384, timeout=300)
+        return call_llm_streamed(prompt, system, llm_model, num_ctx=16384, timeout=300,
+                                 on_progress=on_progress)
     else:
         prompt = solo_script_prompt(
             input_text, target_length,
             articles=articles, kb_context=kb_context,
         )
         system = solo_script_system(output_language=output_language)
-        return call_llm(prompt, system, llm_model, num_ctx=16384, timeout=300)
+        return call_llm_streamed(prompt, system, llm_model, num_ctx=16384, timeout=300,
+                                 on_progress=on_progress)
@@ -0,0 +1,94 @@
+"""Persistent on-disk cache for LLM responses."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DEFAULT_CACHE_PATH = os.path.join(_PROJECT_ROOT, "data", "llm_cache.sqlite")
+
+
+def cache_key(llm_model: str, system_prompt: str, prompt: str, num_ctx: int) -> str:
+    """Hash everything that determines an LLM response into a cache key.
+
+    The prompts are hashed exactly as sent: whitespace can carry meaning
+    (indented code, tables, transcript line breaks), so prompts differing only
+    in whitespace get separate entries.
+    """
+    payload = json.dumps({
+        "model": llm_model,
+        "system": system_prompt,
+        "prompt": prompt,
+        "num_ctx": num_ctx,
+    }, sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed map from cache_key() to response text, safe to share across threads.
+
+    Storage errors are logged and treated as misses so a broken cache never
+    fails an LLM call.
+    """
+
+    def __init__(self, path: str = _DEFAULT_CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str, max_age: float | None = None) -> str | None:
+        """Return the cached response for key, or None on a miss.
+
+        With max_age (seconds), entries stored longer ago than that count as misses.
+        """
+        oldest = time.time() - max_age if max_age is not None else 0.0
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response FROM responses WHERE key = ? AND created_at >= ?", (key, oldest)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response under key, replacing any previous entry."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, opening it on first use."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
@@ -1,3 +1,6 @@
+import functools
+import io
+
 from utils.formatting import format_timestamp
 
 _LANGUAGE_NAMES = {
@@ -63,6 +66,18 @@ def chunk_summary_system(
     output_language: str = "en",
     is_audio: bool = True,
 ) -> str:
+    # Instructions shared by every chunk come first and per-chunk values
+    # (KB context here, the segment itself in the user message) last, so
+    # consecutive requests share the longest possible prompt prefix
+    base = _chunk_summary_base(output_language, is_audio)
+    if not hint and not kb_context:
+        return base
+    return base + _hint_line(hint) + _kb_context_block(kb_context)
+
+
+@functools.lru_cache(maxsize=16)
+def _chunk_summary_base(output_language: str, is_audio: bool) -> str:
+    """The part of chunk_summary_system that is the same for every chunk of a run."""
     lang = _language_name(output_language)
     role = "an audio analyst" if is_audio else "a text analyst"
     source = "audio transcript segments" if is_audio else "text document segments"
@@ -70,7 +85,13 @@ def chunk_summary_system(
 You are {role}. You produce concise, accurate summaries of {source}.
 Focus on key topics discussed, decisions made, action items mentioned, and important statements.
 Do not invent information. If the content is unclear, say so.
-IMPORTANT: Always write your response in {lang}, even if the input is in another language.{_hint_line(hint)}{_kb_context_block(kb_context)}"""
+
+Provide a structured summary with:
+- **Topics Discussed**: Key subjects covered in this segment
+- **Key Points**: Important statements, data, or arguments
+- **Decisions**: Any decisions reached
+- **Action Items**: Tasks or follow-ups mentioned (include who is responsible if mentioned)
+IMPORTANT: Always write your response in {lang}, even if the input is in another language."""
 
 
 def chunk_summary_prompt(
@@ -91,13 +112,7 @@ def chunk_summary_prompt(
 {header}
 
 CONTENT:
-{chunk["text"]}
-
-Provide a structured summary with:
-- **Topics Discussed**: Key subjects covered in this segment
-- **Key Points**: Important statements, data, or arguments
-- **Decisions**: Any decisions reached
-- **Action Items**: Tasks or follow-ups mentioned (include who is responsible if mentioned)"""
+{chunk["text"]}"""
 
 
 def consolidation_system(
@@ -106,29 +121,25 @@ def consolidation_system(
     output_language: str = "en",
     is_audio: bool = True,
 ) -> str:
+    # As in chunk_summary_system, the fixed instructions (including the output
+    # format) lead and the summaries to merge go last, in the user message
+    base = _consolidation_base(output_language, is_audio)
+    if not hint and not kb_context:
+        return base
+    return base + _hint_line(hint) + _kb_context_block(kb_context)
+
+
+@functools.lru_cache(maxsize=16)
+def _consolidation_base(output_language: str, is_audio: bool) -> str:
+    """The part of consolidation_system that does not depend on the input."""
     lang = _language_name(output_language)
     role = "an audio analyst" if is_audio else "a text analyst"
     source = "segment summaries" if is_audio else "section summaries"
     return f"""\
 You are {role}. You merge multiple {source} into a single coherent \
 summary. Produce a concise, well-structured document — keep all sections short and to the point.
-IMPORTANT: Always write your response in {lang}, even if the original content was in another language.{_hint_line(hint)}{_kb_context_block(kb_context)}"""
-
-
-def consolidation_prompt(chunk_summaries: list[str], is_audio: bool = True) -> str:
-    combined = "\n\n---\n\n".join(
-        f"### Segment {i + 1}\n{s}" for i, s in enumerate(chunk_summaries)
-    )
-    source_type = "a single audio recording" if is_audio else "a single document"
-
-    return f"""\
-Below are summaries of consecutive segments from {source_type}. \
-Merge them into one cohesive summary.
-
-SEGMENT SUMMARIES:
-{combined}
 
-Produce a final summary in this format:
+Produce the final summary in this format:
 
 # Summary
 
@@ -148,7 +159,26 @@ Produce a final summary in this format:
 (Brief additional observations, nuances, or noteworthy points)
 
 ## Action Items
-(Bulleted list: task, responsible person if known, deadline if mentioned — omit this section entirely if there are no action items)"""
+(Bulleted list: task, responsible person if known, deadline if mentioned — omit this section entirely if there are no action items)
+IMPORTANT: Always write your response in {lang}, even if the original content was in another language."""
+
+
+def consolidation_prompt(chunk_summaries: list[str], is_audio: bool = True) -> str:
+    buf = io.StringIO()
+    for i, s in enumerate(chunk_summaries):
+        if i:
+            buf.write("\n\n---\n\n")
+        buf.write(f"### Segment {i + 1}\n")
+        buf.write(s)
+    combined = buf.getvalue()
+    source_type = "a single audio recording" if is_audio else "a single document"
+
+    return f"""\
+Below are summaries of consecutive segments from {source_type}. \
+Merge them into one cohesive summary.
+
+SEGMENT SUMMARIES:
+{combined}"""
 
 
 # --- Podcast prompts ---
@@ -160,10 +190,13 @@ If no articles are relevant, return an empty array: []"""
 
 
 def article_ranking_prompt(articles: list[dict], reference_text: str, max_articles: int) -> str:
-    article_list = "\n".join(
-        f"{i}. [{a['title']}] — {a.get('summary', '')[:200]}"
-        for i, a in enumerate(articles)
-    )
+    buf = io.StringIO()
+    for i, a in enumerate(articles):
+        if i:
+            buf.write("\n")
+        buf.write(f"{i}. [{a['title']}] — ")
+        buf.write(a.get("summary", "")[:200])
+    article_list = buf.getvalue()
     return f"""\
 Given these articles and the reference text, select ONLY articles that are genuinely relevant \
 to the reference text. Return their indices as a JSON array, most relevant first.
@@ -183,6 +216,24 @@ ARTICLES:
 Return ONLY a JSON array of integer indices (e.g. [2, 0, 5]) or [] if none are relevant."""
 
 
+def _source_material(input_text: str, articles: list[dict] | None) -> str:
+    """Merge all material into one block so the LLM sees a single pool of content.
+
+    Written piece by piece into one buffer rather than formatting a block per
+    article and joining them afterwards.
+    """
+    buf = io.StringIO()
+    buf.write(input_text[:6000])
+    for a in articles or ():
+        buf.write("\n\n---\n\n[Related: ")
+        buf.write(a["title"])
+        buf.write("]\n")
+        # Selected articles always carry content (extracted text, or their summary)
+        content = a["content"] if "content" in a else a.get("summary", "")
+        buf.write(content[:2000])
+    return buf.getvalue()
+
+
 LENGTH_WORD_TARGETS = {
     "short": 400,
     "medium": 900,
@@ -190,6 +241,7 @@ LENGTH_WORD_TARGETS = {
 }
 
 
+@functools.lru_cache(maxsize=16)
 def solo_script_system(output_language: str = "en") -> str:
     lang = _language_name(output_language)
     return f"""\
@@ -211,15 +263,7 @@ def solo_script_prompt(
 ) -> str:
     word_target = LENGTH_WORD_TARGETS.get(target_length, 900)
 
-    # Merge all material into one block so the LLM sees a single pool of content
-    material_parts = [input_text[:6000]]
-
-    if articles:
-        for a in articles:
-            content = a.get("content", a.get("summary", ""))[:2000]
-            material_parts.append(f"[Related: {a['title']}]\n{content}")
-
-    combined_material = "\n\n---\n\n".join(material_parts)
+    combined_material = _source_material(input_text, articles)
 
     kb_section = _kb_context_block(kb_context) if kb_context else ""
 
@@ -243,6 +287,7 @@ Output ONLY the spoken script. No title, no headers, no labels. Start directly w
 the host speaking. Plain spoken paragraphs only, no markdown, no special symbols, no lists."""
 
 
+@functools.lru_cache(maxsize=16)
 def two_host_script_system(output_language: str = "en") -> str:
     lang = _language_name(output_language)
     return f"""\
@@ -266,15 +311,7 @@ def two_host_script_prompt(
 ) -> str:
     word_target = LENGTH_WORD_TARGETS.get(target_length, 900)
 
-    # Merge all material into one block so the LLM sees a single pool of content
-    material_parts = [input_text[:6000]]
-
-    if articles:
-        for a in articles:
-            content = a.get("content", a.get("summary", ""))[:2000]
-            material_parts.append(f"[Related: {a['title']}]\n{content}")
-
-    combined_material = "\n\n---\n\n".join(material_parts)
+    combined_material = _source_material(input_text, articles)
 
     kb_section = _kb_context_block(kb_context) if kb_context else ""
 
@@ -96,6 +96,9 @@ def _transcribe_mlx(audio_file, model_size, language, progress, task_id):
 
 # --------------- public API ---------------
 
+# One "**[H:MM:SS]** text" or "**[M:SS]** text" line of a written transcript
+_TRANSCRIPT_LINE_RE = re.compile(r"\*\*\[(\d+(?::\d{2}){1,2})\]\*\*\s+(.+)")
+
 
 def parse_transcript(path: str) -> list[dict]:
     """Parse a transcript file and return segments in the same format as transcribe().
@@ -108,31 +111,28 @@ def parse_transcript(path: str) -> list[dict]:
     with open(path, encoding="utf-8") as f:
         content = f.read()
 
-    pattern = re.compile(r"\*\*\[(\d+(?::\d{2}){1,2})\]\*\*\s+(.+)")
-    matches = pattern.findall(content)
-
-    if not matches:
+    # Single pass: each segment ends when the next one starts, so the previous
+    # segment's end is filled in as soon as its successor is parsed
+    segments = []
+    prev = None
+    for match in _TRANSCRIPT_LINE_RE.finditer(content):
+        parts = match.group(1).split(":")
+        seconds = int(parts[-1]) + int(parts[-2]) * 60
+        if len(parts) == 3:
+            seconds += int(parts[0]) * 3600
+        start = float(seconds)
+        if prev is not None:
+            prev["end"] = start
+        prev = {"start": start, "end": start + 1.0, "text": match.group(2).strip()}
+        segments.append(prev)
+
+    if not segments:
         # Plain text fallback — single segment
         text = content.strip()
         if text:
             return [{"start": 0.0, "end": 1.0, "text": text}]
         return []
 
-    segments = []
-    for ts_str, text in matches:
-        parts = ts_str.split(":")
-        if len(parts) == 3:
-            seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-        else:
-            seconds = int(parts[0]) * 60 + int(parts[1])
-        segments.append({"start": float(seconds), "end": 0.0, "text": text.strip()})
-
-    # Fill in end times: each segment ends when the next one starts
-    for i in range(len(segments) - 1):
-        segments[i]["end"] = segments[i + 1]["start"]
-    if segments:
-        segments[-1]["end"] = segments[-1]["start"] + 1.0
-
     return segments
 
 
@@ -6,7 +6,9 @@ from rich.progress import (
     TextColumn,
     TimeElapsedColumn,
 )
-from rich.console import Console
+from rich.console import Console, Group
+from rich.table import Table
+from rich.text import Text
 
 console = Console()
 
@@ -20,3 +22,17 @@ def create_progress() -> Progress:
         TimeElapsedColumn(),
         console=console,
     )
+
+
+def print_header(title: str, fields: dict[str, str]) -> None:
+    """Print a run header (bold title, then aligned 'Label: value' rows) in one render.
+
+    Values are shown verbatim, so paths or hints containing [brackets] are not
+    mistaken for Rich markup.
+    """
+    table = Table(box=None, show_header=False, padding=(0, 1), pad_edge=False)
+    table.add_column(no_wrap=True)
+    table.add_column()
+    for label, value in fields.items():
+        table.add_row(f"  {label}:", Text(value))
+    console.print(Group(f"[bold]{title}[/bold]", table, ""))
@@ -1,3 +1,4 @@
+import functools
 import os
 import warnings
 from pathlib import Path
@@ -27,8 +28,9 @@ def derive_output_dir(source_path):
     return os.path.join(DEFAULT_OUTPUT_DIR, name)
 
 
+@functools.lru_cache(maxsize=1)
 def load_podcast_config():
-    """Load podcast_config.yaml or return defaults."""
+    """Load podcast_config.yaml or return defaults (parsed once per process)."""
     if os.path.isfile(PODCAST_CONFIG_PATH):
         with open(PODCAST_CONFIG_PATH, encoding="utf-8") as f:
             return yaml.safe_load(f) or {}
@@ -116,9 +118,15 @@ def _apply_llm_config_to_env(llm_config: dict) -> None:
 @click.option("--kb", type=click.Path(exists=True, file_okay=False),
               default=None, help="Directory of reference docs for domain-aware summaries (RAG).")
 @click.option("--kb-rebuild", is_flag=True, default=False,
-              help="Force re-index the knowledge base (use when KB files changed).")
+              help="Force a full re-index of the knowledge base (changed files are picked up automatically).")
+@click.option("--kb-workers", type=click.IntRange(min=1), default=None,
+              help="Processes used to extract KB documents when indexing. Default: CPU count - 1.")
 @click.option("--embedding-model", default=None,
               help="Fastembed model for KB embeddings. Default: BAAI/bge-small-en-v1.5.")
+@click.option("--embed-quantized", is_flag=True, default=False,
+              help="Use fastembed's quantized variant of the embedding model when it has one.")
+@click.option("--embed-device", type=click.Choice(["auto", "cpu", "cuda", "coreml"]), default="auto",
+              help="Device for KB embeddings. Default: auto (CUDA when available, else CPU).")
 @click.option("--hint", default=None,
               help="Short label for the audio type (e.g., 'team meeting', 'lecture'). Guides tone/structure.")
 @click.option("--record", "record_flag", is_flag=True, default=False, help="Record audio from an input device.")
@@ -127,9 +135,11 @@ def _apply_llm_config_to_env(llm_config: dict) -> None:
               default=None, help="Summarize a text file or directory (md, pdf, docx, txt, ...).")
 @click.option("--per-file", is_flag=True, default=False,
               help="When summarizing a directory, produce one summary per file instead of one combined summary.")
+@click.option("--max-parallel-files", type=click.IntRange(min=1), default=4,
+              help="With --per-file, how many files to summarize concurrently. Default: 4.")
 def main(audio_file, podcast, model, output_dir, llm_model, input_language, output_language,
-         chunk_minutes, kb, kb_rebuild, embedding_model, hint, record_flag, record_name,
-         summarize, per_file):
+         chunk_minutes, kb, kb_rebuild, kb_workers, embedding_model, embed_quantized, embed_device,
+         hint, record_flag, record_name, summarize, per_file, max_parallel_files):
     """Transcribe and summarize audio, summarize text, generate podcasts, or record audio.
 
     \b
@@ -175,12 +185,15 @@ def main(audio_file, podcast, model, output_dir, llm_model, input_language, outp
     if podcast is not None:
         from cli.podcast import run_podcast
         run_podcast(podcast, output_dir, llm_model, kb_dir=kb, kb_rebuild=kb_rebuild,
-                    embedding_model=embedding_model, output_language=output_language)
+                    embedding_model=embedding_model, output_language=output_language,
+                    kb_workers=kb_workers, embed_quantized=embed_quantized, embed_device=embed_device)
     else:
         from cli.summarizer import run_summarizer
         run_summarizer(audio_file, model, output_dir, llm_model, input_language, chunk_minutes,
                        kb_dir=kb, kb_rebuild=kb_rebuild, embedding_model=embedding_model, hint=hint,
-                       input_path=summarize, per_file=per_file, output_language=output_language)
+                       input_path=summarize, per_file=per_file, output_language=output_language,
+                       max_parallel_files=max_parallel_files, kb_workers=kb_workers,
+                       embed_quantized=embed_quantized, embed_device=embed_device)
 
 
 if __name__ == "__main__":
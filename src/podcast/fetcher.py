@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import feedparser
 import trafilatura
@@ -8,18 +9,37 @@ logger = logging.getLogger(__name__)
 
 
 RSS_FETCH_TIMEOUT = 30
+RSS_FETCH_CONCURRENCY = 8
 
 
-def fetch_rss_articles(feed_urls: list[str], max_per_feed: int = 10) -> list[dict]:
-    """Fetch recent articles from RSS feeds."""
+def _download_feed(url: str) -> bytes | None:
     import urllib.request
+    try:
+        with urllib.request.urlopen(url, timeout=RSS_FETCH_TIMEOUT) as resp:
+            return resp.read()
+    except Exception as e:
+        logger.debug("Failed to fetch RSS feed %s: %s", url, e)
+        return None
+
+
+def fetch_rss_articles(feed_urls: list[str], max_per_feed: int = 10) -> list[dict]:
+    """Fetch recent articles from RSS feeds.
+
+    Feeds are downloaded concurrently and parsed in the order given.
+    """
     articles = []
     seen_urls = set()
+    if not feed_urls:
+        return articles
 
-    for url in feed_urls:
+    with ThreadPoolExecutor(max_workers=min(len(feed_urls), RSS_FETCH_CONCURRENCY)) as pool:
+        bodies = list(pool.map(_download_feed, feed_urls))
+
+    for url, body in zip(feed_urls, bodies):
+        if body is None:
+            continue
         try:
-            resp = urllib.request.urlopen(url, timeout=RSS_FETCH_TIMEOUT)
-            feed = feedparser.parse(resp.read())
+            feed = feedparser.parse(body)
             for entry in feed.entries[:max_per_feed]:
                 link = entry.get("link", "")
                 if not link or link in seen_urls:
@@ -32,7 +52,7 @@ def fetch_rss_articles(feed_urls: list[str], max_per_feed: int = 10) -> list[dic
                     "source": "rss",
                 })
         except Exception as e:
-            logger.debug("Failed to fetch RSS feed %s: %s", url, e)
+            logger.debug("Failed to parse RSS feed %s: %s", url, e)
             continue
 
     return articles
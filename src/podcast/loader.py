@@ -1,6 +1,7 @@
 """Load input text from a file or directory for podcast generation."""
 
 import os
+from collections.abc import Iterator
 
 from core.knowledge_base import SUPPORTED_EXTENSIONS, extract_text, find_supported_files
 
@@ -32,14 +33,24 @@ def load_input_text(path: str) -> tuple[str, list[str]]:
             )
         parts = []
         used_files = []
-        for filepath in files:
-            text = extract_text(filepath)
-            if text and text.strip():
-                filename = os.path.basename(filepath)
-                parts.append(f"--- {filename} ---\n{text.strip()}")
-                used_files.append(filepath)
+        for filepath, text in iter_labelled_texts(files):
+            parts.append(text)
+            used_files.append(filepath)
         if not parts:
             raise ValueError(f"No extractable text found in files under {path}")
         return "\n\n".join(parts), used_files
 
     raise ValueError(f"Path does not exist: {path}")
+
+
+def iter_labelled_texts(files: list[str]) -> Iterator[tuple[str, str]]:
+    """Yield (filepath, text) for each file with extractable text, one file at a time.
+
+    Each text is stripped and prefixed with a '--- filename ---' line, the
+    same form load_input_text joins into its combined text.
+    """
+    for filepath in files:
+        text = extract_text(filepath)
+        if text and text.strip():
+            filename = os.path.basename(filepath)
+            yield filepath, f"--- {filename} ---\n{text.strip()}"
@@ -1,8 +1,12 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from core.llm import generate_podcast_script, rank_articles
 from podcast.fetcher import extract_article_text, fetch_rss_articles, search_web_articles
 
+# Network-bound enrichment requests (feeds, search, article pages) in flight at once
+FETCH_CONCURRENCY = 4
+
 
 def generate_podcast(
     input_text: str,
@@ -35,47 +39,59 @@ def generate_podcast(
 
     selected = []
 
-    if enrichment_enabled:
-        # Stage 1: Fetch articles
-        task_fetch = progress.add_task("Fetching articles...", total=None)
-        all_articles = fetch_rss_articles(feed_urls) if feed_urls else []
-
-        if web_search_enabled:
-            web_articles = search_web_articles(input_text)
-            seen = {a["url"] for a in all_articles}
-            for a in web_articles:
-                if a["url"] not in seen:
-                    all_articles.append(a)
-                    seen.add(a["url"])
-
-        progress.update(task_fetch, total=1, completed=1)
-
-        if all_articles:
-            # Stage 2: Rank articles by relevance to input text
-            task_rank = progress.add_task("Ranking articles by relevance...", total=1)
-            top_indices = rank_articles(all_articles, input_text, max_articles, llm_model)
-            selected = [all_articles[i] for i in top_indices]
-            progress.update(task_rank, completed=1)
-
-            # Stage 3: Extract full text for selected articles
-            if selected:
-                task_extract = progress.add_task("Extracting article content...", total=len(selected))
-                for article in selected:
-                    text = extract_article_text(article["url"])
-                    article["content"] = text or article.get("summary", "")
-                    progress.advance(task_extract)
-
-    # Stage 4: Generate script
-    task_script = progress.add_task("Writing podcast script...", total=1)
-    script_kb = None
-    if kb:
-        script_kb = kb.retrieve(input_text[:1000], top_k=5, max_chars=3000)
-        script_kb = script_kb or None
+    # Stages that only depend on the input run side by side: KB lookup for
+    # the script, RSS fetch and web search, then the per-article downloads
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as pool:
+        kb_future = (
+            pool.submit(kb.retrieve, input_text[:1000], top_k=5, max_chars=3000)
+            if kb else None
+        )
+
+        if enrichment_enabled:
+            # Stage 1: Fetch articles
+            task_fetch = progress.add_task("Fetching articles...", total=None)
+            rss_future = pool.submit(fetch_rss_articles, feed_urls) if feed_urls else None
+            web_future = pool.submit(search_web_articles, input_text) if web_search_enabled else None
+            all_articles = rss_future.result() if rss_future else []
+
+            if web_future:
+                web_articles = web_future.result()
+                seen = {a["url"] for a in all_articles}
+                for a in web_articles:
+                    if a["url"] not in seen:
+                        all_articles.append(a)
+                        seen.add(a["url"])
+
+            progress.update(task_fetch, total=1, completed=1)
+
+            if all_articles:
+                # Stage 2: Rank articles by relevance to input text
+                task_rank = progress.add_task("Ranking articles by relevance...", total=1)
+                top_indices = rank_articles(all_articles, input_text, max_articles, llm_model)
+                selected = [all_articles[i] for i in top_indices]
+                progress.update(task_rank, completed=1)
+
+                # Stage 3: Extract full text for selected articles
+                if selected:
+                    task_extract = progress.add_task("Extracting article content...", total=len(selected))
+                    texts = pool.map(extract_article_text, [a["url"] for a in selected])
+                    for article, text in zip(selected, texts):
+                        article["content"] = text or article.get("summary", "")
+                        progress.advance(task_extract)
+
+        # Stage 4: Generate script
+        task_script = progress.add_task("Writing podcast script...", total=1)
+        script_kb = (kb_future.result() or None) if kb_future else None
+
+    def on_progress(chars):
+        progress.update(task_script, description=f"Writing podcast script... ({chars:,} chars)")
+
     script = generate_podcast_script(
         input_text, style, target_length, llm_model,
         articles=selected or None,
         kb_context=script_kb,
         output_language=output_language,
+        on_progress=on_progress,
     )
     progress.update(task_script, completed=1)
 
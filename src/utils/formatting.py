@@ -1,7 +1,6 @@
 def format_timestamp(seconds: float) -> str:
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
     if h > 0:
         return f"{h:d}:{m:02d}:{s:02d}"
     return f"{m:d}:{s:02d}"
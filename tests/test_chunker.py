@@ -0,0 +1,153 @@
+"""Tests for core.chunker module — word-based text and time-based transcript chunking."""
+
+import numpy as np
+import pytest
+
+from core.chunker import (
+    _chunk_boundaries,
+    _word_count,
+    chunk_paragraphs,
+    chunk_text,
+    chunk_transcript,
+    iter_paragraphs,
+    split_paragraphs,
+)
+
+
+def _segments(ends: list[float]) -> list[dict]:
+    starts = [0.0] + ends[:-1]
+    return [{"start": s, "end": e, "text": f"seg{i}"} for i, (s, e) in enumerate(zip(starts, ends))]
+
+
+def _reference_chunks(segments: list[dict], chunk_minutes: int) -> list[dict]:
+    """Straightforward linear scan used to check the optimized implementation."""
+    chunk_seconds = chunk_minutes * 60
+    chunks, current, chunk_start = [], [], 0.0
+    for seg in segments:
+        current.append(seg)
+        if seg["end"] - chunk_start >= chunk_seconds:
+            chunks.append((chunk_start, seg["end"], [s["text"] for s in current]))
+            chunk_start = seg["end"]
+            current = []
+    if current:
+        chunks.append((chunk_start, current[-1]["end"], [s["text"] for s in current]))
+    return chunks
+
+
+class TestChunkText:
+    def test_empty(self):
+        assert chunk_text("  \n\n ") == []
+
+    def test_single_chunk(self):
+        chunks = chunk_text("First paragraph.\n\nSecond paragraph.")
+        assert chunks == [{"text": "First paragraph.\n\nSecond paragraph.", "chunk_index": 0}]
+
+    def test_splits_on_word_budget(self):
+        para = " ".join(["word"] * 4)
+        chunks = chunk_text("\n\n".join([para] * 5), chunk_words=10)
+        assert [c["chunk_index"] for c in chunks] == [0, 1, 2]
+        assert [c["text"].count("\n\n") for c in chunks] == [1, 1, 0]
+
+    def test_oversized_paragraph_is_own_chunk(self):
+        big = " ".join(["word"] * 30)
+        chunks = chunk_text(f"small\n\n{big}\n\nsmall", chunk_words=10)
+        assert [c["text"] for c in chunks] == ["small", big, "small"]
+
+
+class TestChunkParagraphs:
+    def test_streamed_matches_joined_text(self):
+        parts = [f"--- f{i}.md ---\n" + "\n\n".join(" ".join(["w"] * (i + 3)) for _ in range(4))
+                 for i in range(6)]
+        streamed = chunk_paragraphs(
+            (p for part in parts for p in split_paragraphs(part)), chunk_words=20,
+        )
+        assert streamed == chunk_text("\n\n".join(parts), chunk_words=20)
+
+    def test_bisect_matches_running_total(self):
+        rng = np.random.default_rng(2)
+        for _ in range(500):
+            text = "\n\n".join(" ".join(["w"] * int(n)) for n in rng.integers(1, 12, size=rng.integers(0, 15)))
+            paragraphs = split_paragraphs(text)
+            assert chunk_text(text, chunk_words=15) == chunk_paragraphs(paragraphs, chunk_words=15)
+
+    def test_split_paragraphs(self):
+        assert split_paragraphs("\n\n \n") == []
+        assert split_paragraphs(" a \n\n b ") == ["a", "b"]
+        assert split_paragraphs("line one\nline two") == ["line one\nline two"]
+
+
+class TestIterParagraphs:
+    def test_matches_split_of_joined_blocks(self):
+        rng = np.random.default_rng(1)
+        for _ in range(2000):
+            blocks = ["".join(rng.choice(list("ab\n "), size=rng.integers(0, 7)))
+                      for _ in range(rng.integers(0, 7))]
+            assert list(iter_paragraphs(blocks)) == split_paragraphs("\n".join(blocks))
+
+    def test_paragraph_spans_blocks(self):
+        assert list(iter_paragraphs(["end of page", "next page\n", "\nnew para"])) == \
+            ["end of page\nnext page", "new para"]
+
+
+class TestWordCount:
+    def test_matches_str_split(self):
+        rng = np.random.default_rng(0)
+        ascii_alphabet = list("ab \t\n\r\x0b\x0c\x1c\x1f.")
+        for alphabet in (ascii_alphabet, ascii_alphabet + ["\xa0", "\u2003", "é"]):
+            for size in (0, 10, 1023, 1024, 5000):
+                for _ in range(20):
+                    para = "".join(rng.choice(alphabet, size=size))
+                    assert _word_count(para) == len(para.split())
+
+    def test_long_ascii_paragraph(self):
+        para = "  " + "  ".join(["word"] * 400) + "\n"
+        assert _word_count(para) == 400
+
+
+class TestChunkTranscript:
+    def test_empty(self):
+        assert chunk_transcript([]) == []
+
+    def test_non_positive_chunk_minutes(self):
+        with pytest.raises(ValueError, match="chunk_minutes must be positive"):
+            chunk_transcript(_segments([10.0, 20.0]), chunk_minutes=0)
+        with pytest.raises(ValueError, match="chunk_minutes must be positive"):
+            chunk_transcript([], chunk_minutes=-1)
+
+    def test_single_partial_chunk(self):
+        chunks = chunk_transcript(_segments([10.0, 20.0, 30.0]), chunk_minutes=1)
+        assert len(chunks) == 1
+        assert chunks[0]["start_time"] == 0.0
+        assert chunks[0]["end_time"] == 30.0
+        assert chunks[0]["text"] == "seg0 seg1 seg2"
+        assert len(chunks[0]["segments"]) == 3
+
+    def test_boundary_is_inclusive(self):
+        chunks = chunk_transcript(_segments([30.0, 60.0, 90.0]), chunk_minutes=1)
+        assert [c["end_time"] for c in chunks] == [60.0, 90.0]
+        assert chunks[1]["start_time"] == 60.0
+        assert chunks[1]["text"] == "seg2"
+
+    def test_exact_final_boundary_has_no_empty_tail(self):
+        chunks = chunk_transcript(_segments([30.0, 60.0]), chunk_minutes=1)
+        assert len(chunks) == 1
+        assert chunks[0]["end_time"] == 60.0
+
+    def test_matches_linear_scan(self):
+        ends = [i * 7.3 + (i % 5) for i in range(1, 400)]
+        segments = _segments(ends)
+        chunks = chunk_transcript(segments, chunk_minutes=2)
+        expected = _reference_chunks(segments, chunk_minutes=2)
+        got = [(c["start_time"], c["end_time"], [s["text"] for s in c["segments"]]) for c in chunks]
+        assert got == expected
+        assert all(c["text"] == " ".join(s["text"] for s in c["segments"]) for c in chunks)
+
+
+class TestChunkBoundaries:
+    def test_includes_tail_index(self):
+        ends = np.array([30.0, 60.0, 90.0])
+        assert _chunk_boundaries(ends, 60).tolist() == [1, 2]
+
+    def test_one_boundary_per_window(self):
+        ends = np.arange(1.0, 11.0)
+        assert _chunk_boundaries(ends, 3).tolist() == [2, 5, 8, 9]
@@ -0,0 +1,38 @@
+"""Tests for core.embedding_cache module — query embedding keys and persistence."""
+
+from core.embedding_cache import EmbeddingCache, embedding_key
+
+
+class TestEmbeddingKey:
+    def test_stable(self):
+        assert embedding_key("m", "text") == embedding_key("m", "text")
+
+    def test_distinguishes_model_and_text(self):
+        base = embedding_key("m", "text")
+        assert embedding_key("other", "text") != base
+        assert embedding_key("m", "text ") != base
+
+
+class TestEmbeddingCache:
+    def test_get_many_returns_only_hits(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "emb.sqlite"))
+        assert cache.get_many(["a", "b"]) == {}
+        cache.set_many({"a": [0.5, -1.25]})
+        assert cache.get_many(["a", "b", "a"]) == {"a": [0.5, -1.25]}
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "emb.sqlite")
+        cache = EmbeddingCache(path)
+        cache.set_many({"k": [1.0, 2.0, 3.0]})
+        cache.close()
+        reopened = EmbeddingCache(path)
+        assert reopened.get_many(["k"]) == {"k": [1.0, 2.0, 3.0]}
+        reopened.close()
+
+    def test_many_keys(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "emb.sqlite"))
+        vectors = {str(i): [float(i)] for i in range(1200)}
+        cache.set_many(vectors)
+        assert cache.get_many(vectors) == vectors
+        cache.close()
@@ -1,6 +1,17 @@
 """Tests for core.knowledge_base module — text chunking and extraction helpers."""
 
-from core.knowledge_base import _chunk_text
+import os
+import threading
+from types import SimpleNamespace
+
+from core.embedding_cache import EmbeddingCache
+from core.knowledge_base import (
+    KnowledgeBase,
+    _bounded_map,
+    _chunk_text,
+    embedding_providers,
+    find_supported_files,
+)
 
 
 class TestChunkText:
@@ -28,3 +39,260 @@ class TestChunkText:
     def test_chunk_source_preserved(self):
         chunks = _chunk_text("Hello world", "readme.md")
         assert all(c["source"] == "readme.md" for c in chunks)
+
+
+class _Model:
+    """Stand-in embedding model: each query maps to a one-hot-ish vector."""
+
+    def __init__(self):
+        self.embedded = []
+
+    def query_embed(self, queries):
+        self.embedded.extend(queries)
+        return [SimpleNamespace(tolist=lambda q=q: [float(ord(q[0]))]) for q in queries]
+
+
+class _BatchClient:
+    """Stand-in for the Qdrant client that answers search_batch from a fixed table."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.model = _Model()
+        self.embedding_models = {"test-model": self.model}
+        self.batches = []
+
+    def collection_exists(self, name):
+        return True
+
+    def get_vector_field_name(self):
+        return "fast-test"
+
+    def search_batch(self, collection_name, requests):
+        queries = [chr(int(r.vector.vector[0])) for r in requests]
+        self.batches.append(queries)
+        return [
+            [p for p in self.answers.get(q, []) if p.score >= r.score_threshold][:r.limit]
+            for q, r in zip(queries, requests)
+        ]
+
+
+def _point(pid, score, text, source="kb.md"):
+    return SimpleNamespace(id=pid, score=score, payload={"document": text, "source": source})
+
+
+def _kb_with(client, tmp_path):
+    kb = KnowledgeBase.__new__(KnowledgeBase)
+    kb.client = client
+    kb.collection = "knowledge_base"
+    kb.embedding_model = "test-model"
+    kb._embedding_cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite"))
+    kb._lock = threading.Lock()
+    return kb
+
+
+class TestRetrieve:
+    def test_per_query_aligned_in_one_batch(self, tmp_path):
+        client = _BatchClient({
+            "a": [_point(1, 0.9, "alpha")],
+            "b": [_point(2, 0.2, "too weak")],
+            "c": [_point(3, 0.8, "gamma"), _point(1, 0.7, "alpha")],
+        })
+        kb = _kb_with(client, tmp_path)
+        contexts = kb.retrieve_per_query(["a", "b", "c"], top_k_per_query=3)
+        assert client.batches == [["a", "b", "c"]]
+        assert contexts == [
+            "[From: kb.md]\nalpha",
+            "",
+            "[From: kb.md]\ngamma\n\n[From: kb.md]\nalpha",
+        ]
+
+    def test_per_query_empty(self, tmp_path):
+        client = _BatchClient({})
+        assert _kb_with(client, tmp_path).retrieve_per_query([]) == []
+        assert client.batches == []
+
+    def test_merged_dedupes_by_best_score(self, tmp_path):
+        client = _BatchClient({
+            "a": [_point(1, 0.5, "alpha")],
+            "c": [_point(3, 0.8, "gamma"), _point(1, 0.7, "alpha")],
+        })
+        context = _kb_with(client, tmp_path).retrieve_multi(["a", "c"])
+        assert context == "[From: kb.md]\ngamma\n\n[From: kb.md]\nalpha"
+
+    def test_embeddings_are_cached(self, tmp_path):
+        client = _BatchClient({"a": [_point(1, 0.9, "alpha")]})
+        kb = _kb_with(client, tmp_path)
+        assert kb.retrieve("a") == "[From: kb.md]\nalpha"
+        kb.retrieve_per_query(["a", "b", "b"])
+        assert client.model.embedded == ["a", "b"]
+
+
+class TestFormatPoints:
+    def test_truncates_to_max_chars(self):
+        points = [_point(1, 0.9, "a" * 50), _point(2, 0.8, "b" * 300), _point(3, 0.7, "c")]
+        context = KnowledgeBase._format_points(points, max_chars=200)
+        first = "[From: kb.md]\n" + "a" * 50
+        assert context == first + "\n\n" + ("[From: kb.md]\n" + "b" * 300)[:200 - len(first)] + "..."
+
+    def test_drops_short_remainder(self):
+        points = [_point(1, 0.9, "a" * 150), _point(2, 0.8, "b" * 300)]
+        assert KnowledgeBase._format_points(points, max_chars=200) == "[From: kb.md]\n" + "a" * 150
+
+
+class _AddClient:
+    """Stub Qdrant client that records add() batches and keeps point payloads by id."""
+
+    def __init__(self):
+        self.added = []
+        self.points = {}
+
+    def collection_exists(self, collection_name):
+        return bool(self.points)
+
+    def add(self, collection_name, documents, metadata, ids):
+        self.added.append((list(documents), list(metadata)))
+        self.points.update((pid, dict(m)) for pid, m in zip(ids, metadata))
+
+    def delete(self, collection_name, points_selector):
+        for point_id in points_selector.points:
+            del self.points[point_id]
+
+    def set_payload(self, collection_name, payload, points):
+        for point_id in points:
+            self.points[point_id].update(payload)
+
+
+def _write_docs(docs):
+    docs.mkdir(exist_ok=True)
+    for i in range(6):
+        (docs / f"f{i}.md").write_text("\n\n".join(" ".join([f"f{i}p{j}"] * 300) for j in range(i)))
+
+
+def _index_kb(store, docs, workers=1, client=None):
+    store.mkdir(exist_ok=True)
+    kb = KnowledgeBase.__new__(KnowledgeBase)
+    kb.client = client or _AddClient()
+    kb.collection = "knowledge_base"
+    kb.embedding_model = "test-model"
+    kb.store_path = str(store)
+    kb.embed_batch_size = 4
+    processed = kb.index_directory(str(docs), workers=workers)
+    return kb, processed
+
+
+class TestIndexDirectory:
+    def _index(self, tmp_path, workers):
+        _write_docs(tmp_path / "docs")
+        kb, processed = _index_kb(tmp_path / f"store{workers}", tmp_path / "docs", workers)
+        return processed, kb.client.added, kb.chunk_count
+
+    def test_process_pool_matches_inline(self, tmp_path):
+        inline = self._index(tmp_path, workers=1)
+        pooled = self._index(tmp_path, workers=3)
+        assert pooled == inline
+        processed, added, chunk_count = pooled
+        assert processed == 5  # f0.md is empty
+        assert chunk_count == 15
+        assert [len(docs) for docs, _ in added] == [4, 4, 4, 3]
+        sources = [m["sources"] for _, metadata in added for m in metadata]
+        assert sources[:3] == [["f1.md"], ["f2.md"], ["f2.md"]]
+
+    def test_reindex_skips_unchanged_files(self, tmp_path):
+        docs = tmp_path / "docs"
+        _write_docs(docs)
+        kb, _ = _index_kb(tmp_path / "store", docs)
+        client = kb.client
+        client.added.clear()
+
+        kb, processed = _index_kb(tmp_path / "store", docs, client=client)
+        assert processed == 0
+        assert client.added == []
+        assert kb.chunk_count == 15
+
+    def test_reindex_replaces_changed_and_removed_files(self, tmp_path):
+        docs = tmp_path / "docs"
+        _write_docs(docs)
+        kb, _ = _index_kb(tmp_path / "store", docs)
+        client = kb.client
+        client.added.clear()
+
+        (docs / "f5.md").write_text("short")   # 5 chunks -> 1
+        (docs / "f4.md").unlink()              # 4 chunks removed
+        kb, processed = _index_kb(tmp_path / "store", docs, client=client)
+        assert processed == 1
+        assert [m["sources"] for _, metadata in client.added for m in metadata] == [["f5.md"]]
+        assert kb.chunk_count == len(client.points) == 7
+
+    def test_identical_chunks_stored_once(self, tmp_path):
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("shared footer\n\n" + " ".join(["a"] * 600))
+        (docs / "b.md").write_text("shared footer")
+        kb, _ = _index_kb(tmp_path / "store", docs)
+        client = kb.client
+        documents = [doc for docs_, _ in client.added for doc in docs_]
+        assert len(documents) == len(set(documents)) == 2
+        assert sorted(m["sources"] for m in client.points.values()) == [["a.md"], ["a.md", "b.md"]]
+
+        # The shared point survives until the last file containing it is gone
+        (docs / "a.md").unlink()
+        kb, _ = _index_kb(tmp_path / "store", docs, client=client)
+        assert [m["sources"] for m in client.points.values()] == [["b.md"]]
+        assert kb.chunk_count == 1
+
+    def test_format_shows_every_source(self):
+        point = SimpleNamespace(id=1, score=0.9, payload={"document": "text", "sources": ["a.md", "b.md"]})
+        assert KnowledgeBase._format_points([point], max_chars=1000) == "[From: a.md, b.md]\ntext"
+
+
+class TestFindSupportedFiles:
+    def test_files_sorted_before_subdirectories(self, tmp_path):
+        for rel in ["b.md", "a.TXT", "z/c.pdf", "m/d.csv", "m/n/e.html", ".hidden.md", "notes.xyz", "README"]:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        found = [os.path.relpath(p, tmp_path) for p in find_supported_files(str(tmp_path))]
+        assert found == ["a.TXT", "b.md", os.path.join("m", "d.csv"),
+                         os.path.join("m", "n", "e.html"), os.path.join("z", "c.pdf")]
+
+    def test_missing_directory(self, tmp_path):
+        assert find_supported_files(str(tmp_path / "missing")) == []
+
+
+class TestEmbeddingProviders:
+    def test_cpu(self):
+        assert embedding_providers("cpu") is None
+
+    def test_requested_provider_with_cpu_fallback(self, monkeypatch):
+        import onnxruntime
+        monkeypatch.setattr(onnxruntime, "get_available_providers",
+                            lambda: ["CoreMLExecutionProvider", "CPUExecutionProvider"])
+        assert embedding_providers("coreml") == ["CoreMLExecutionProvider", "CPUExecutionProvider"]
+        assert embedding_providers("cuda") is None
+
+    def test_auto_needs_cuda_build_and_gpu(self, monkeypatch):
+        import onnxruntime
+        from core import hardware
+        monkeypatch.setattr(onnxruntime, "get_available_providers",
+                            lambda: ["CUDAExecutionProvider", "CPUExecutionProvider"])
+        monkeypatch.setattr(hardware, "get_nvidia_vram_gb", lambda: 24.0)
+        assert embedding_providers("auto") == ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        monkeypatch.setattr(hardware, "get_nvidia_vram_gb", lambda: None)
+        assert embedding_providers("auto") is None
+
+
+class TestBoundedMap:
+    def test_ordered_and_bounded(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        submitted = []
+
+        def work(x):
+            submitted.append(x)
+            return x * x
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = _bounded_map(pool, work, range(10), window=3)
+            assert next(results) == 0
+            assert len(submitted) <= 4
+            assert list(results) == [x * x for x in range(1, 10)]
@@ -1,7 +1,15 @@
 """Tests for core.llm module — provider detection and JSON parsing."""
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
-from core.llm import detect_provider
+import litellm
+import pytest
+
+import core.llm
+from core.llm import _env_int, _parse_ranking, call_llm, call_llm_streamed, detect_provider, rank_articles
 
 
 class TestDetectProvider:
@@ -67,3 +75,199 @@ class TestRankArticlesJsonParsing:
         start = text.index("[")
         end = text.rindex("]") + 1
         assert json.loads(text[start:end]) == [[1, 2], 3]
+
+
+class TestParseRanking:
+    def test_filters_invalid_and_truncates(self):
+        assert _parse_ranking('Ranked: [3, "x", 9, 0, 1]', num_articles=5, max_articles=2) == [3, 0]
+
+    def test_array_inside_prose(self):
+        assert _parse_ranking("Sure!\n[ 2 ,1,\n4 ]\nThese fit best.", num_articles=5, max_articles=5) == [2, 1, 4]
+
+    def test_answer_after_quoted_example(self):
+        response = "The format is like [0, 1]. My answer: [4, 2, 3]"
+        assert _parse_ranking(response, num_articles=5, max_articles=5) == [4, 2, 3]
+
+    def test_empty_array(self):
+        assert _parse_ranking("[]", num_articles=5, max_articles=2) == []
+
+    def test_unparsable(self):
+        assert _parse_ranking("no ranking here", num_articles=5, max_articles=2) is None
+
+
+class TestCallLlmStreamed:
+    def test_collects_pieces_in_order(self, monkeypatch):
+        calls = []
+
+        def completion(stream=False, **kwargs):
+            calls.append((stream, kwargs["model"], kwargs["num_ctx"]))
+            for piece in ["Hello", None, ", ", "world"]:
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+            # Usage-only final chunk
+            yield SimpleNamespace(choices=[], usage={"completion_tokens": 3})
+
+        monkeypatch.setattr(litellm, "completion", completion)
+        seen = []
+        assert call_llm_streamed("p", "s", "llama3.1:8b", on_progress=seen.append) == "Hello, world"
+        assert seen == [5, 7, 12]
+        assert calls == [(True, "ollama/llama3.1:8b", 8192)]
+
+    def test_progress_restarts_on_retry(self, monkeypatch):
+        attempts = []
+
+        def completion(stream=False, **kwargs):
+            attempts.append(1)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hel"))])
+            if len(attempts) == 1:
+                raise litellm.APIConnectionError("dropped", "ollama", "llama3.1:8b")
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="lo"))])
+
+        monkeypatch.setattr(litellm, "completion", completion)
+        monkeypatch.setattr(core.llm.time, "sleep", lambda s: None)
+        seen = []
+        assert call_llm_streamed("p", "s", "llama3.1:8b", on_progress=seen.append) == "Hello"
+        assert seen == [3, 3, 5]
+
+
+class TestCallLlmRetries:
+    def _completion(self, calls, errors):
+        def completion(**kwargs):
+            calls.append(kwargs["model"])
+            if errors:
+                raise errors.pop(0)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+        return completion
+
+    def test_retries_transient_error_with_backoff(self, monkeypatch):
+        calls, sleeps = [], []
+        errors = [litellm.APIConnectionError("down", "ollama", "llama3.1:8b")]
+        monkeypatch.setattr(litellm, "completion", self._completion(calls, errors))
+        monkeypatch.setattr(core.llm.time, "sleep", sleeps.append)
+        assert call_llm("p", "s", "llama3.1:8b") == "ok"
+        assert len(calls) == 2
+        assert len(sleeps) == 1 and 2 <= sleeps[0] <= 3
+
+    def test_permanent_error_fails_fast(self, monkeypatch):
+        calls, sleeps = [], []
+        errors = [litellm.AuthenticationError("bad key", "openai", "gpt-4o")]
+        monkeypatch.setattr(litellm, "completion", self._completion(calls, errors))
+        monkeypatch.setattr(core.llm.time, "sleep", sleeps.append)
+        with pytest.raises(litellm.AuthenticationError):
+            call_llm("p", "s", "gpt-4o", retries=3)
+        assert len(calls) == 1
+        assert sleeps == []
+
+
+class TestAdaptiveTimeout:
+    def _completion(self, timeouts, errors=()):
+        errors = list(errors)
+
+        def completion(**kwargs):
+            timeouts.append(kwargs["timeout"])
+            if errors:
+                raise errors.pop(0)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+        return completion
+
+    def test_shrinks_first_attempt_after_warmup(self, monkeypatch):
+        timeouts = []
+        monkeypatch.setattr(litellm, "completion", self._completion(timeouts))
+        monkeypatch.setattr(core.llm, "_LATENCY_EMA", {})
+        for _ in range(core.llm.LATENCY_WARMUP_CALLS):
+            call_llm("p", "s", "gpt-4o", timeout=120)
+        assert timeouts == [120] * core.llm.LATENCY_WARMUP_CALLS
+        call_llm("p", "s", "gpt-4o", timeout=120)
+        assert timeouts[-1] == core.llm.LATENCY_TIMEOUT_MIN
+
+    def test_not_used_for_ollama(self, monkeypatch):
+        timeouts = []
+        monkeypatch.setattr(litellm, "completion", self._completion(timeouts))
+        monkeypatch.setattr(core.llm, "_LATENCY_EMA", {("llama3.1:8b", 8192): (20.0, 10)})
+        call_llm("p", "s", "llama3.1:8b", timeout=120)
+        assert timeouts == [120]
+
+    def test_early_attempt_does_not_use_up_retries(self, monkeypatch):
+        timeouts = []
+        errors = [
+            litellm.Timeout("slow", "gpt-4o", "openai"),
+            litellm.APIConnectionError("down", "openai", "gpt-4o"),
+        ]
+        monkeypatch.setattr(litellm, "completion", self._completion(timeouts, errors))
+        monkeypatch.setattr(core.llm.time, "sleep", lambda s: None)
+        monkeypatch.setattr(core.llm, "_LATENCY_EMA", {("gpt-4o", 8192): (20.0, 10)})
+        assert call_llm("p", "s", "gpt-4o", timeout=120) == "ok"
+        assert timeouts == [30.0, 120, 120]
+
+
+class TestRankArticles:
+    def _articles(self, n):
+        return [{"title": f"a{i}", "summary": ""} for i in range(n)]
+
+    def test_small_list_is_one_call(self, monkeypatch):
+        calls = []
+
+        def rank_group(articles, reference_text, max_articles, llm_model):
+            calls.append(len(articles))
+            return [2, 0]
+
+        monkeypatch.setattr(core.llm, "_rank_group", rank_group)
+        assert rank_articles(self._articles(5), "ref", 3, "m") == [2, 0]
+        assert calls == [5]
+
+    def test_groups_then_reranks_picks(self, monkeypatch):
+        calls = []
+
+        def rank_group(articles, reference_text, max_articles, llm_model):
+            titles = [a["title"] for a in articles]
+            calls.append(titles)
+            # Pick the last two of each group; the final round reverses the candidates
+            if len(calls) <= 3:
+                return [len(articles) - 1, len(articles) - 2]
+            return list(range(len(articles)))[::-1][:max_articles]
+
+        monkeypatch.setattr(core.llm, "_rank_group", rank_group)
+        monkeypatch.setattr(core.llm, "RANKING_GROUP_SIZE", 4)
+        monkeypatch.setattr(core.llm, "LLM_CONCURRENCY", 1)
+        result = rank_articles(self._articles(10), "ref", 3, "m")
+        assert calls[-1] == ["a3", "a2", "a7", "a6", "a9", "a8"]
+        assert result == [8, 9, 6]
+
+
+class TestEnvInt:
+    def test_default_when_unset(self, monkeypatch):
+        monkeypatch.delenv("RECAP_TEST_INT", raising=False)
+        assert _env_int("RECAP_TEST_INT", 4) == 4
+
+    def test_reads_positive_integer(self, monkeypatch):
+        monkeypatch.setenv("RECAP_TEST_INT", " 8 ")
+        assert _env_int("RECAP_TEST_INT", 4) == 8
+
+    def test_invalid_falls_back(self, monkeypatch):
+        for value in ("zero", "0", "-2"):
+            monkeypatch.setenv("RECAP_TEST_INT", value)
+            assert _env_int("RECAP_TEST_INT", 4) == 4
+
+
+class TestLlmSlots:
+    def test_caps_requests_across_pools(self, monkeypatch):
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def completion(**kwargs):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+        monkeypatch.setattr(litellm, "completion", completion)
+        monkeypatch.setattr(core.llm, "_llm_slots", threading.BoundedSemaphore(2))
+        monkeypatch.setattr(core.llm, "_LATENCY_EMA", {})
+        # Two independent pools, as with --per-file summaries
+        with ThreadPoolExecutor(4) as a, ThreadPoolExecutor(4) as b:
+            futures = [pool.submit(call_llm, "p", "s", "gpt-4o") for pool in (a, b) for _ in range(8)]
+            assert all(f.result() == "ok" for f in futures)
+        assert max(peak) == 2
@@ -0,0 +1,55 @@
+"""Tests for core.llm_cache module — response cache keys and persistence."""
+
+from core.llm_cache import ResponseCache, cache_key
+
+
+class TestCacheKey:
+    def test_stable(self):
+        assert cache_key("m", "sys", "prompt", 8192) == cache_key("m", "sys", "prompt", 8192)
+
+    def test_whitespace_sensitive(self):
+        assert cache_key("m", "sys", "a  b\n\nc", 8192) != cache_key("m", "sys", "a b c", 8192)
+        assert cache_key("m", "sys", "    code()", 8192) != cache_key("m", "sys", "code()", 8192)
+        assert cache_key("m", "sys\n", "p", 8192) != cache_key("m", "sys", "p", 8192)
+
+    def test_distinguishes_inputs(self):
+        base = cache_key("m", "sys", "prompt", 8192)
+        assert cache_key("other", "sys", "prompt", 8192) != base
+        assert cache_key("m", "other", "prompt", 8192) != base
+        assert cache_key("m", "sys", "other", 8192) != base
+        assert cache_key("m", "sys", "prompt", 16384) != base
+
+
+class TestResponseCache:
+    def test_miss_then_hit(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        assert cache.get("k") is None
+        cache.set("k", "response")
+        assert cache.get("k") == "response"
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = ResponseCache(path)
+        cache.set("k", "response")
+        cache.close()
+        reopened = ResponseCache(path)
+        assert reopened.get("k") == "response"
+        reopened.close()
+
+    def test_overwrite(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        cache.set("k", "old")
+        cache.set("k", "new")
+        assert cache.get("k") == "new"
+        cache.close()
+
+    def test_max_age(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        cache.set("k", "response")
+        assert cache.get("k", max_age=60) == "response"
+        with cache._conn:
+            cache._conn.execute("UPDATE responses SET created_at = created_at - 120")
+        assert cache.get("k", max_age=60) is None
+        assert cache.get("k") == "response"
+        cache.close()
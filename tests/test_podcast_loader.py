@@ -3,7 +3,7 @@ import os
 
 import pytest
 
-from podcast.loader import load_input_text
+from podcast.loader import iter_labelled_texts, load_input_text
 
 
 class TestLoadInputTextFile:
@@ -68,6 +68,14 @@ class TestLoadInputTextDirectory:
         assert len(files) == 1
 
 
+class TestIterLabelledTexts:
+    def test_yields_labelled_text_per_file(self, tmp_path):
+        (tmp_path / "a.txt").write_text("  Content A\n")
+        (tmp_path / "b.txt").write_text("")
+        files = [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+        assert list(iter_labelled_texts(files)) == [(files[0], "--- a.txt ---\nContent A")]
+
+
 class TestLoadInputTextInvalidPath:
     def test_nonexistent_path_raises(self):
         with pytest.raises(ValueError, match="Path does not exist"):
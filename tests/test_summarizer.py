@@ -0,0 +1,28 @@
+"""Tests for cli.summarizer module — per-file error reporting."""
+
+import pytest
+
+import cli.summarizer as summarizer
+from cli.summarizer import ChunkSummarizationError
+
+
+class TestSummarizePerFile:
+    def test_failure_names_file_and_lists_written(self, monkeypatch, tmp_path):
+        files = [str(tmp_path / name) for name in ("a.md", "bad.md", "c.md")]
+
+        def summarize_chunks(chunks, *args, label=None):
+            if label == "bad.md":
+                raise ChunkSummarizationError(1, ["done", None], RuntimeError("timeout"))
+            return f"summary of {label}"
+
+        monkeypatch.setattr(summarizer, "find_supported_files", lambda path: files)
+        monkeypatch.setattr(summarizer, "extract_text", lambda path: "Some text.")
+        monkeypatch.setattr(summarizer, "_summarize_chunks", summarize_chunks)
+        monkeypatch.setattr(summarizer, "write_summary_named",
+                            lambda summary, output_dir, stem: f"{output_dir}/summary_{stem}.md")
+
+        with pytest.raises(ChunkSummarizationError) as info:
+            summarizer._summarize_per_file(str(tmp_path), "out", "m", None, None, "en", None, 2)
+        assert info.value.source == "bad.md"
+        assert str(info.value) == "Summarization failed on chunk 2 of bad.md: timeout"
+        assert info.value.written == [("Summary", "out/summary_a.md"), ("Summary", "out/summary_c.md")]
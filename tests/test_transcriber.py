@@ -0,0 +1,30 @@
+"""Tests for core.transcriber module — parsing written transcripts back into segments."""
+
+from core.transcriber import parse_transcript
+
+
+class TestParseTranscript:
+    def test_timestamped_lines(self, tmp_path):
+        path = tmp_path / "transcript.md"
+        path.write_text(
+            "# Transcript\n\n"
+            "**[0:05]** Hello there.\n\n"
+            "**[1:02:03]**   Much later.  \n\n"
+            "**[1:02:10]** The end.\n",
+            encoding="utf-8",
+        )
+        assert parse_transcript(str(path)) == [
+            {"start": 5.0, "end": 3723.0, "text": "Hello there."},
+            {"start": 3723.0, "end": 3730.0, "text": "Much later."},
+            {"start": 3730.0, "end": 3731.0, "text": "The end."},
+        ]
+
+    def test_plain_text_is_one_segment(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("\n  Just some text.\n", encoding="utf-8")
+        assert parse_transcript(str(path)) == [{"start": 0.0, "end": 1.0, "text": "Just some text."}]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_text("  \n", encoding="utf-8")
+        assert parse_transcript(str(path)) == []